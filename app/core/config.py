@@ -16,10 +16,49 @@ class Settings(BaseSettings):
     # GitLab settings
     GITLAB_URL: str
     GITLAB_TOKEN: str
+    GITLAB_WEBHOOK_SECRET: Optional[str] = None  # must match the "Secret token" of the GitLab webhook
+
+    # Webhook ingestion queue
+    WEBHOOK_QUEUE_SIZE: int = 10000
+    WEBHOOK_BATCH_SIZE: int = 500
+    WEBHOOK_FLUSH_INTERVAL: float = 1.0  # seconds to wait for more events before writing a batch
+
+    # Release assembly jobs
+    RELEASE_JOB_WORKERS: int = 4
+    TASK_DEPENDENCY_MAX_DEPTH: int = 100  # how far dependency checks follow chains of tasks
+    TASK_DEPENDENCY_CLOSURE_CHECK: bool = True  # verify the closure table at startup and rebuild it if stale
+    RELEASE_CHECK_WORKERS: int = 8  # checks run concurrently, each with its own database connection
+    RELEASE_CHECK_TIMEOUT: float = 30.0  # seconds, default per check
+    TASK_IMPORT_BATCH_SIZE: int = 500  # NDJSON lines written per transaction by POST /tasks/bulk
+    TASK_DETAIL_MAX_DEPTH: int = 10  # deepest dependency tree GET /tasks/{id} may return
 
     # YouTrack settings
     YOUTRACK_URL: str
     YOUTRACK_TOKEN: str
+    YOUTRACK_SYNC_PAGE_SIZE: int = 500
+    YOUTRACK_SYNC_OVERLAP_MINUTES: int = 1440  # re-read window: YouTrack queries dates in the server time zone
+    YOUTRACK_DEPENDENCY_LINK_TYPES: List[str] = ["Depend"]
+
+    # Outbound HTTP client settings (shared by GitLab and YouTrack services)
+    HTTP_CONNECT_TIMEOUT: float = 3.05
+    HTTP_READ_TIMEOUT: float = 30.0
+    HTTP_POOL_CONNECTIONS: int = 10  # number of per-host pools kept alive
+    HTTP_POOL_MAXSIZE: int = 20  # max connections per host
+    HTTP_POOL_BLOCK: bool = True  # wait for a free connection instead of opening extra ones
+    HTTP_MAX_CONCURRENCY: int = 20  # default fan-out limit for async batch calls
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_BACKOFF_BASE: float = 0.5  # seconds, doubled per attempt with full jitter
+    HTTP_BACKOFF_MAX: float = 30.0
+    HTTP_RATE_LIMIT_MAX_WAIT: float = 60.0  # fail instead of waiting longer for a rate limit reset
+    HTTP_CIRCUIT_FAILURE_THRESHOLD: int = 5  # consecutive failures that open the breaker
+    HTTP_CIRCUIT_RESET_TIMEOUT: float = 30.0  # seconds before a half-open probe is allowed
+
+    # Conditional GET cache for GitLab/YouTrack reads
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_TTL: float = 30.0  # seconds an entry is served without revalidation
+    HTTP_CACHE_MAX_ENTRIES: int = 2048
+    HTTP_CACHE_PATH: Optional[str] = None  # sqlite file for the on-disk tier, disabled if unset
+    HTTP_CACHE_DISK_MAX_ENTRIES: int = 50000
     
     # JWT authentication
     SECRET_KEY: str = "your-secret-key-keep-it-secret!"
@@ -1 +1,23 @@
- 
\ No newline at end of file
+from typing import Optional
+
+
+class IntegrationError(Exception):
+    """Base error for failures talking to GitLab/YouTrack."""
+
+
+class CircuitOpenError(IntegrationError):
+    """Raised without sending a request while a host's circuit breaker is open."""
+
+    def __init__(self, host: str, retry_after: Optional[float] = None):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f"Circuit breaker for {host} is open, upstream considered unavailable")
+
+
+class RateLimitExceededError(IntegrationError):
+    """Raised when a host's rate limit would make the caller wait too long."""
+
+    def __init__(self, host: str, retry_after: Optional[float] = None):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f"Rate limit for {host} exhausted, retry in {retry_after or 0:.0f}s")
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 
 from app.database.session import SessionLocal, engine, Base
 from app.models import Project, Branch, Task, Tag, TaskStatus
+from app.services.task_graph import refresh_dependency_closure
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -102,6 +103,8 @@ def init_db() -> None:
         # Add dependencies
         release_task.dependencies.append(task1)
         release_task.dependencies.append(task2)
+        db.flush()
+        refresh_dependency_closure(db, [release_task.id])
         
         db.commit()
         logger.info("Database initialized with example data")
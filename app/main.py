@@ -1,12 +1,19 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 import uvicorn
 import logging
 
 from app.core.config import settings
-from app.routers import auth, projects, branches, tasks, releases
-from app.database.session import engine, Base
+from app.core.exceptions import CircuitOpenError, RateLimitExceededError
+from app.routers import auth, projects, branches, tasks, releases, integrations, webhooks
+from app.database.session import engine, Base, SessionLocal
+from app.services.pagination import NEXT_CURSOR_HEADER
 from app.database.init_db import init_db
+from app.services.http_client import close_http_client, close_async_http_client
+from app.services.webhook_ingestion import ingestion_queue
+from app.services.release_jobs import release_job_queue
+from app.services.task_graph import check_dependency_closure
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -31,6 +38,7 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
 # Include routers
@@ -39,6 +47,50 @@ app.include_router(projects.router, prefix=settings.API_V1_STR)
 app.include_router(branches.router, prefix=settings.API_V1_STR)
 app.include_router(tasks.router, prefix=settings.API_V1_STR)
 app.include_router(releases.router, prefix=settings.API_V1_STR)
+app.include_router(integrations.router, prefix=settings.API_V1_STR)
+app.include_router(webhooks.router, prefix=settings.API_V1_STR)
+
+
+@app.exception_handler(CircuitOpenError)
+@app.exception_handler(RateLimitExceededError)
+async def upstream_unavailable_handler(request: Request, exc: Exception):
+    headers = {}
+    if exc.retry_after:
+        headers["Retry-After"] = str(int(exc.retry_after) + 1)
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers=headers)
+
+
+@app.on_event("startup")
+def check_task_dependency_closure():
+    # Without a check the closure table is not trusted and dependency checks walk the graph
+    if not settings.TASK_DEPENDENCY_CLOSURE_CHECK:
+        return
+    db = SessionLocal()
+    try:
+        check_dependency_closure(db)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Task dependency closure check failed: {e}")
+    finally:
+        db.close()
+
+
+@app.on_event("startup")
+def start_background_workers():
+    ingestion_queue.start()
+    release_job_queue.start()
+
+
+@app.on_event("shutdown")
+def stop_background_workers():
+    ingestion_queue.stop()
+    release_job_queue.stop()
+    close_http_client()
+
+
+@app.on_event("shutdown")
+async def close_async_clients():
+    await close_async_http_client()
 
 
 @app.get("/")
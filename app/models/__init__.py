@@ -1,6 +1,7 @@
 from app.models.project import Project
 from app.models.branch import Branch
 from app.models.task import Task, Tag, TaskStatus
-from app.models.release import Release, ReleaseCheck, ReleaseStatus
-from app.models.commit import Commit
-from app.models.merge_request import MergeRequest, MergeRequestStatus 
\ No newline at end of file
+from app.models.release import Release, ReleaseCheck, ReleaseStatus, ReleaseJob, ReleaseJobStatus, ReleaseCheckCache
+from app.models.commit import Commit, CommitRange
+from app.models.merge_request import MergeRequest, MergeRequestStatus
+from app.models.sync_cursor import SyncCursor 
\ No newline at end of file
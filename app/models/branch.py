@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 import datetime
 
@@ -7,6 +7,11 @@ from app.database.session import Base
 
 class Branch(Base):
     __tablename__ = "branches"
+    __table_args__ = (
+        # Keyset pagination of GET /branches, overall and per project
+        Index("ix_branches_created_at_id", "created_at", "id"),
+        Index("ix_branches_project_created_at_id", "project_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)
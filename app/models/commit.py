@@ -1,15 +1,25 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Table, UniqueConstraint
 from sqlalchemy.orm import relationship
 import datetime
 
 from app.database.session import Base
 
 
+# Commits of a cached compare range, in the order GitLab returned them
+commit_range_commits = Table(
+    "commit_range_commits",
+    Base.metadata,
+    Column("range_id", Integer, ForeignKey("commit_ranges.id", ondelete="CASCADE"), primary_key=True),
+    Column("commit_id", Integer, ForeignKey("commits.id", ondelete="CASCADE"), primary_key=True),
+    Column("position", Integer, nullable=False)
+)
+
+
 class Commit(Base):
     __tablename__ = "commits"
 
     id = Column(Integer, primary_key=True, index=True)
-    hash = Column(String, index=True, nullable=False)
+    hash = Column(String, index=True, unique=True, nullable=False)
     message = Column(Text, nullable=True)
     author = Column(String, nullable=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=True)
@@ -21,4 +31,22 @@ class Commit(Base):
     
     # Relationships
     task = relationship("Task", back_populates="commits")
-    release = relationship("Release", back_populates="commits") 
\ No newline at end of file
+    release = relationship("Release", back_populates="commits") 
+
+
+class CommitRange(Base):
+    """Result of a GitLab compare between two SHAs; a SHA range never changes, so it is kept forever."""
+    __tablename__ = "commit_ranges"
+    __table_args__ = (
+        UniqueConstraint("project_id", "from_sha", "to_sha", name="uq_commit_ranges_project_shas"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    from_sha = Column(String, nullable=False)
+    to_sha = Column(String, nullable=False)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+    # Relationships
+    project = relationship("Project")
+    commits = relationship("Commit", secondary=commit_range_commits, order_by=commit_range_commits.c.position)
\ No newline at end of file
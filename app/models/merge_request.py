@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Enum, UniqueConstraint
 from sqlalchemy.orm import relationship
 import datetime
 import enum
@@ -15,8 +15,12 @@ class MergeRequestStatus(enum.Enum):
 
 class MergeRequest(Base):
     __tablename__ = "merge_requests"
+    __table_args__ = (
+        UniqueConstraint("project_id", "iid", name="uq_merge_requests_project_iid"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
+    iid = Column(Integer, nullable=True)  # GitLab MR number within the project
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     source_branch = Column(String, nullable=False)
@@ -24,6 +28,8 @@ class MergeRequest(Base):
     status = Column(Enum(MergeRequestStatus), default=MergeRequestStatus.OPEN)
     can_be_merged = Column(Boolean, default=False)
     assigned_to = Column(String, nullable=True)
+    pipeline_status = Column(String, nullable=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=True)
     release_id = Column(Integer, ForeignKey("releases.id"), nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
@@ -31,4 +37,5 @@ class MergeRequest(Base):
     
     # Relationships
     task = relationship("Task")
-    release = relationship("Release", back_populates="merge_requests") 
\ No newline at end of file
+    release = relationship("Release", back_populates="merge_requests")
+    project = relationship("Project", back_populates="merge_requests") 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 import datetime
 
@@ -7,14 +7,20 @@ from app.database.session import Base
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created_at_id", "created_at", "id"),  # keyset pagination of GET /projects
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)
     description = Column(Text, nullable=True)
+    gitlab_project_id = Column(String, index=True, nullable=True)
+    youtrack_project_id = Column(String, index=True, nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     
     # Relationships
     branches = relationship("Branch", back_populates="project")
     releases = relationship("Release", back_populates="project")
-    tasks = relationship("Task", back_populates="project") 
\ No newline at end of file
+    tasks = relationship("Task", back_populates="project")
+    merge_requests = relationship("MergeRequest", back_populates="project") 
\ No newline at end of file
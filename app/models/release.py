@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Enum, Float, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 import datetime
 import enum
@@ -6,6 +7,13 @@ import enum
 from app.database.session import Base
 
 
+class ReleaseJobStatus(enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
 class ReleaseStatus(enum.Enum):
     DRAFT = "draft"
     IN_PROGRESS = "in_progress"
@@ -15,6 +23,11 @@ class ReleaseStatus(enum.Enum):
 
 class Release(Base):
     __tablename__ = "releases"
+    __table_args__ = (
+        # Keyset pagination of GET /releases, overall and per project
+        Index("ix_releases_created_at_id", "created_at", "id"),
+        Index("ix_releases_project_created_at_id", "project_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True, nullable=False)
@@ -22,6 +35,9 @@ class Release(Base):
     status = Column(Enum(ReleaseStatus), default=ReleaseStatus.DRAFT)
     project_id = Column(Integer, ForeignKey("projects.id"))
     branch_id = Column(Integer, ForeignKey("branches.id"))
+    source_branch_id = Column(Integer, ForeignKey("branches.id"), nullable=True)
+    # use_alter: tasks.release_id points back at releases
+    release_task_id = Column(Integer, ForeignKey("tasks.id", use_alter=True, name="fk_releases_release_task_id"), nullable=True)
     skip_pipeline = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
@@ -29,6 +45,8 @@ class Release(Base):
     # Relationships
     project = relationship("Project", back_populates="releases")
     branch = relationship("Branch", foreign_keys=[branch_id], back_populates="release")
+    source_branch = relationship("Branch", foreign_keys=[source_branch_id], back_populates="source_releases")
+    release_task = relationship("Task", foreign_keys=[release_task_id], back_populates="as_release_task")
     tasks = relationship("Task", foreign_keys="[Task.release_id]", back_populates="release")
     merge_requests = relationship("MergeRequest", back_populates="release")
     checks = relationship("ReleaseCheck", back_populates="release")
@@ -37,14 +55,53 @@ class Release(Base):
 
 class ReleaseCheck(Base):
     __tablename__ = "release_checks"
+    __table_args__ = (
+        Index("ix_release_checks_type_status", "check_type", "status"),
+        # Serves containment lookups such as details @> '[{"task_id": 1}]'
+        Index("ix_release_checks_details", "details", postgresql_using="gin", postgresql_ops={"details": "jsonb_path_ops"}),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     release_id = Column(Integer, ForeignKey("releases.id"))
     check_type = Column(String, nullable=False)  # task_status, task_dependencies, project_dependencies, commit_check
     status = Column(String, nullable=False)  # success, warning, error
     message = Column(Text, nullable=True)
-    details = Column(Text, nullable=True)  # JSON serialized data
+    details = Column(JSONB, nullable=True)  # check data, usually a list of per-task entries
+    duration_ms = Column(Float, nullable=True)  # wall time of the check
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     
     # Relationships
-    release = relationship("Release", back_populates="checks") 
\ No newline at end of file
+    release = relationship("Release", back_populates="checks") 
+
+
+class ReleaseCheckCache(Base):
+    """Last result of a release check for a release task, valid while the fingerprint matches."""
+    __tablename__ = "release_check_cache"
+
+    release_task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    check_type = Column(String, primary_key=True)
+    fingerprint = Column(String, nullable=False)  # md5 of the (id, version) pairs of the tasks the check reads
+    status = Column(String, nullable=False)
+    message = Column(Text, nullable=True)
+    details = Column(JSONB, nullable=True)
+    duration_ms = Column(Float, nullable=True)
+    computed_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+
+class ReleaseJob(Base):
+    __tablename__ = "release_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(Enum(ReleaseJobStatus), default=ReleaseJobStatus.QUEUED, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id"))
+    release_id = Column(Integer, ForeignKey("releases.id"), nullable=True)
+    payload = Column(Text, nullable=False)  # JSON serialized ReleaseCreate
+    result = Column(Text, nullable=True)  # JSON serialized ReleaseAssemblyResponse
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    # Relationships
+    project = relationship("Project")
+    release = relationship("Release")
\ No newline at end of file
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, BigInteger, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.orm import relationship
+import datetime
+
+from app.database.session import Base
+
+
+class SyncCursor(Base):
+    __tablename__ = "sync_cursors"
+    __table_args__ = (
+        UniqueConstraint("source", "project_id", name="uq_sync_cursors_source_project"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String, nullable=False)  # youtrack
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    cursor = Column(BigInteger, nullable=True)  # last seen upstream "updated" timestamp, ms since epoch
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+    # Relationships
+    project = relationship("Project")
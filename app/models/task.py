@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Table
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Table, Index
 from sqlalchemy.orm import relationship
 import datetime
 import enum
@@ -22,6 +22,29 @@ task_dependencies = Table(
     Column("dependency_id", Integer, ForeignKey("tasks.id"), primary_key=True)
 )
 
+# Transitive closure of task_dependencies: every task reachable from ancestor_id,
+# with the length of the shortest chain; maintained by app.services.task_graph
+task_dependency_closure = Table(
+    "task_dependency_closure",
+    Base.metadata,
+    Column("ancestor_id", Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
+    Column("descendant_id", Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True, index=True),
+    Column("depth", Integer, nullable=False)
+)
+
+# Pairs of task_dependency_closure whose tasks belong to different projects,
+# i.e. what each task needs from other projects; maintained by app.services.task_graph
+cross_project_dependencies = Table(
+    "cross_project_dependencies",
+    Base.metadata,
+    Column("task_id", Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
+    Column("dependency_id", Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True, index=True),
+    Column("project_id", Integer, ForeignKey("projects.id"), nullable=False),
+    Column("dependency_project_id", Integer, ForeignKey("projects.id"), nullable=False),
+    Column("depth", Integer, nullable=False),
+    Index("ix_cross_project_dependencies_projects", "project_id", "dependency_project_id")
+)
+
 # Task tags association table
 task_tags = Table(
     "task_tags",
@@ -33,10 +56,17 @@ task_tags = Table(
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination of GET /tasks, overall and per project / release
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_project_created_at_id", "project_id", "created_at", "id"),
+        Index("ix_tasks_release_created_at_id", "release_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True, nullable=False)
     description = Column(Text, nullable=True)
+    youtrack_id = Column(String, index=True, unique=True, nullable=True)  # readable id, e.g. "EXP-1"
     status = Column(String, nullable=False, default=TaskStatus.TO_DO.value)
     author = Column(String, nullable=True)
     developer = Column(String, nullable=True)
@@ -44,6 +74,7 @@ class Task(Base):
     project_id = Column(Integer, ForeignKey("projects.id"))
     branch_id = Column(Integer, ForeignKey("branches.id"), nullable=True)
     release_id = Column(Integer, ForeignKey("releases.id"), nullable=True)
+    version = Column(Integer, nullable=False, default=1)  # bumped on changes seen by release checks
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     
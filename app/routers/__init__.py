@@ -1 +1 @@
-from app.routers import auth, projects, branches, tasks, releases 
\ No newline at end of file
+from app.routers import auth, projects, branches, tasks, releases, integrations, webhooks 
\ No newline at end of file
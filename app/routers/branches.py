@@ -1,28 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database.session import get_db
 from app.models import Branch, Project
 from app.schemas import Branch as BranchSchema, BranchCreate, BranchUpdate
 from app.routers.auth import get_current_active_user
+from app.services.pagination import paginate, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/branches", tags=["branches"])
 
 
 @router.get("/", response_model=List[BranchSchema])
 def get_branches(
+    response: Response,
     project_id: int = None,
     skip: int = 0, 
     limit: int = 100, 
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)
 ):
-    """Get all branches, optionally filtered by project."""
+    """Get all branches, optionally filtered by project, oldest first; pass the X-Next-Cursor header back as `cursor` for the next page."""
     query = db.query(Branch)
     if project_id:
         query = query.filter(Branch.project_id == project_id)
-    branches = query.offset(skip).limit(limit).all()
+    try:
+        branches, next_cursor = paginate(query, Branch, cursor, skip, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return branches
 
 
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends
+from typing import Dict, Any
+
+from app.routers.auth import get_current_active_user
+from app.services.http_client import get_http_client, async_http_stats
+from app.services.http_cache import get_response_cache
+from app.services.singleflight import flights, async_flights
+from app.services.rate_limit import scheduler_stats
+from app.services.webhook_ingestion import ingestion_queue
+from app.services.release_jobs import release_job_queue
+
+router = APIRouter(prefix="/integrations", tags=["integrations"])
+
+
+@router.get("/stats", response_model=Dict[str, Any])
+def get_integration_stats(
+    current_user = Depends(get_current_active_user)
+):
+    """Get usage statistics of the outbound GitLab/YouTrack HTTP client."""
+    cache = get_response_cache()
+    return {
+        "http": get_http_client().stats(),
+        "async_http": async_http_stats(),
+        "cache": cache.stats() if cache is not None else None,
+        "coalescing": {
+            "sync": flights.stats(),
+            "async": async_flights.stats()
+        },
+        "hosts": scheduler_stats(),
+        "webhooks": ingestion_queue.stats(),
+        "release_jobs": release_job_queue.stats()
+    }
@@ -1,24 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Dict, Any, Optional
 
 from app.database.session import get_db
 from app.models import Project
 from app.schemas import Project as ProjectSchema, ProjectCreate, ProjectUpdate
 from app.routers.auth import get_current_active_user
+from app.services.pagination import paginate, NEXT_CURSOR_HEADER
+from app.services.youtrack_sync import sync_project_in_background
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
 @router.get("/", response_model=List[ProjectSchema])
 def get_projects(
+    response: Response,
     skip: int = 0, 
     limit: int = 100, 
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)
 ):
-    """Get all projects."""
-    projects = db.query(Project).offset(skip).limit(limit).all()
+    """Get all projects, oldest first; pass the X-Next-Cursor header back as `cursor` for the next page."""
+    query = db.query(Project)
+    try:
+        projects, next_cursor = paginate(query, Project, cursor, skip, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return projects
 
 
@@ -83,4 +93,23 @@ def delete_project(
         
     db.delete(db_project)
     db.commit()
-    return None 
\ No newline at end of file
+    return None 
+
+
+@router.post("/{project_id}/sync-youtrack", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
+def sync_project_with_youtrack(
+    project_id: int,
+    background_tasks: BackgroundTasks,
+    full: bool = False,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)
+):
+    """Start mirroring YouTrack issues changed since the last sync into project tasks."""
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not project.youtrack_project_id:
+        raise HTTPException(status_code=400, detail="Project has no YouTrack project configured")
+
+    background_tasks.add_task(sync_project_in_background, project_id, full)
+    return {"success": True, "message": "YouTrack sync started"}
\ No newline at end of file
@@ -1,29 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from app.database.session import get_db
-from app.models import Release, Project, Task, Branch
+from app.models import Release, Project, Task, Branch, ReleaseJob
 from app.schemas import (
     Release as ReleaseSchema, ReleaseCreate, ReleaseUpdate, 
-    ReleaseWithChecks, ReleaseAssemblyResponse
+    ReleaseWithChecks, ReleaseJob as ReleaseJobSchema,
+    ReleaseChecksPreview, ReleaseTasksAdd, ReleaseTasksAddResponse, ReleaseCheck as ReleaseCheckSchema
 )
 from app.routers.auth import get_current_active_user
 from app.services.release_service import ReleaseService
+from app.services.release_jobs import release_job_queue
+from app.services.pagination import paginate, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/releases", tags=["releases"])
 
 
 @router.get("/", response_model=List[ReleaseSchema])
 def get_releases(
+    response: Response,
     project_id: int = None,
     status: str = None,
     skip: int = 0, 
     limit: int = 100, 
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)
 ):
-    """Get all releases with optional filters."""
+    """Get all releases with optional filters, oldest first; pass the X-Next-Cursor header back as `cursor` for the next page."""
     query = db.query(Release)
     
     if project_id:
@@ -31,10 +36,59 @@ def get_releases(
     if status:
         query = query.filter(Release.status == status)
         
-    releases = query.offset(skip).limit(limit).all()
+    try:
+        releases, next_cursor = paginate(query, Release, cursor, skip, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return releases
 
 
+@router.get("/jobs/{job_id}", response_model=ReleaseJobSchema)
+def get_release_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)
+):
+    """Get the status and result of a release assembly job."""
+    job = db.query(ReleaseJob).filter(ReleaseJob.id == job_id).first()
+    if job is None:
+        raise HTTPException(status_code=404, detail="Release job not found")
+    return job
+
+
+@router.get("/checks", response_model=List[ReleaseCheckSchema])
+def query_release_checks(
+    check_type: str = None,
+    status: str = None,
+    task_id: int = None,
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)
+):
+    """Find stored release checks by type, status and a task mentioned in their details."""
+    release_service = ReleaseService(db)
+    checks = release_service.query_checks(check_type, status, task_id, skip, limit)
+    # The JSON is built by the database; return it as is
+    return Response(content=checks, media_type="application/json")
+
+
+@router.get("/checks/preview", response_model=ReleaseChecksPreview)
+def preview_release_checks(
+    release_task_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)
+):
+    """Run the release checks for a release task without assembling; unchanged checks are served from cache."""
+    release_service = ReleaseService(db)
+    checks, recomputed = release_service.run_checks(release_task_id)
+    if checks is None:
+        raise HTTPException(status_code=404, detail="Release task not found")
+    return {"release_task_id": release_task_id, "checks": checks, "recomputed": recomputed}
+
+
 @router.get("/{release_id}", response_model=ReleaseWithChecks)
 def get_release(
     release_id: int, 
@@ -48,26 +102,33 @@ def get_release(
     return release
 
 
-@router.post("/", response_model=ReleaseAssemblyResponse, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=ReleaseJobSchema, status_code=status.HTTP_202_ACCEPTED)
 def create_release(
     release: ReleaseCreate, 
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)
 ):
-    """Create a new release and perform all necessary checks and operations."""
+    """Queue release assembly; poll /releases/jobs/{id} for the checks and the created release."""
     project = db.query(Project).filter(Project.id == release.project_id).first()
     if project is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    branch = db.query(Branch).filter(Branch.id == release.branch_id).first()
-    if branch is None:
+    source_branch = db.query(Branch).filter(
+        Branch.id == release.source_branch_id,
+        Branch.project_id == release.project_id
+    ).first()
+    if source_branch is None:
         raise HTTPException(status_code=404, detail="Branch not found")
 
-    # Use the release service to create the release with all checks and operations
-    release_service = ReleaseService(db)
-    result = release_service.assemble_release(release)
-    
-    return result
+    release_task = db.query(Task).filter(Task.id == release.release_task_id).first()
+    if release_task is None:
+        raise HTTPException(status_code=404, detail="Release task not found")
+
+    if release.source_branch_name is None:
+        release.source_branch_name = source_branch.name
+
+    # Checks, branch and merge request creation run on the release job workers
+    return release_job_queue.enqueue(db, release)
 
 
 @router.put("/{release_id}", response_model=ReleaseSchema)
@@ -139,6 +200,21 @@ def add_task_to_release(
     return result
 
 
+@router.post("/{release_id}/tasks", response_model=ReleaseTasksAddResponse)
+def add_tasks_to_release(
+    release_id: int,
+    tasks: ReleaseTasksAdd,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)
+):
+    """Add several tasks to an existing release; each task gets its own result."""
+    release_service = ReleaseService(db)
+    result = release_service.add_tasks_to_release(release_id, tasks.task_ids)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Release not found")
+    return result
+
+
 @router.get("/{release_id}/commits", response_model=List[Dict[str, Any]])
 def get_release_commits(
     release_id: int,
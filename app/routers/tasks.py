@@ -1,17 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+import json
 
-from app.database.session import get_db
-from app.models import Task, Project, Tag, Branch
-from app.schemas import Task as TaskSchema, TaskCreate, TaskUpdate, TaskDetail, TaskProblem
+from app.core.config import settings
+from app.database.session import get_db, SessionLocal
+from app.models import Task, Project, Branch
+from app.schemas import (
+    Task as TaskSchema, TaskCreate, TaskUpdate, TaskDetail, TaskProblem, TaskProblems, TaskProblemsRequest,
+    TaskSaved
+)
 from app.routers.auth import get_current_active_user
+from app.services.task_graph import refresh_dependency_closure, refresh_project_dependencies, transitive_dependents
+from app.services.task_detail import load_task_detail
+from app.services.task_problems import find_task_problems
+from app.services.task_relations import set_task_tags, set_task_dependencies
+from app.services.task_import import TaskImportService, ndjson_batches
+from app.services.pagination import paginate, NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
+class RequestStreamingResponse(StreamingResponse):
+    """StreamingResponse for generators that still read the request body.
+
+    StreamingResponse listens for a disconnect by calling receive() while it
+    streams, which would take body chunks away from request.stream(); a
+    disconnect surfaces through request.stream() instead.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+# Task fields read by the release checks; changing one bumps Task.version
+RELEASE_CHECK_FIELDS = {"title", "status", "author", "developer", "project_id"}
+
+
 @router.get("/", response_model=List[TaskSchema])
 def get_tasks(
+    response: Response,
     project_id: int = None,
     branch_id: int = None,
     release_id: int = None,
@@ -19,10 +51,11 @@ def get_tasks(
     status: str = None,
     skip: int = 0, 
     limit: int = 100, 
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)
 ):
-    """Get all tasks with optional filters."""
+    """Get all tasks with optional filters, oldest first; pass the X-Next-Cursor header back as `cursor` for the next page."""
     query = db.query(Task)
     
     if project_id:
@@ -36,24 +69,30 @@ def get_tasks(
     if status:
         query = query.filter(Task.status == status)
         
-    tasks = query.offset(skip).limit(limit).all()
+    try:
+        tasks, next_cursor = paginate(query, Task, cursor, skip, limit)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return tasks
 
 
 @router.get("/{task_id}", response_model=TaskDetail)
 def get_task(
     task_id: int, 
+    depth: int = Query(1, ge=0, le=settings.TASK_DETAIL_MAX_DEPTH),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)
 ):
-    """Get a specific task by ID."""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    """Get a specific task by ID, with its dependencies nested `depth` levels deep."""
+    task = load_task_detail(db, task_id, depth)
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
 
-@router.post("/", response_model=TaskSchema, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=TaskSaved, status_code=status.HTTP_201_CREATED)
 def create_task(
     task: TaskCreate, 
     db: Session = Depends(get_db),
@@ -82,28 +121,46 @@ def create_task(
     
     # Add tags
     if tags:
-        for tag_name in tags:
-            # Get or create tag
-            tag = db.query(Tag).filter(Tag.name == tag_name).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                db.add(tag)
-                db.flush()
-            db_task.tags.append(tag)
+        set_task_tags(db, db_task.id, tags, replace=False)
     
     # Add dependencies
+    missing_dependency_ids = []
     if dependency_ids:
-        for dep_id in dependency_ids:
-            dep_task = db.query(Task).filter(Task.id == dep_id).first()
-            if dep_task:
-                db_task.dependencies.append(dep_task)
+        missing_dependency_ids = set_task_dependencies(db, db_task.id, dependency_ids, replace=False)
+        refresh_dependency_closure(db, [db_task.id])
     
     db.commit()
     db.refresh(db_task)
-    return db_task
+    response = TaskSaved.model_validate(db_task, from_attributes=True)
+    response.missing_dependency_ids = missing_dependency_ids
+    return response
+
+
+@router.post("/bulk")
+async def import_tasks(
+    request: Request,
+    current_user = Depends(get_current_active_user)
+):
+    """Import tasks from an NDJSON body of TaskCreate records (one per line).
+
+    Lines are read and written in batches as the body arrives, and a JSON
+    result per line is streamed back: {"line", "success", "id",
+    "missing_dependency_ids"} or {"line", "success": false, "error"}.
+    """
+    async def results():
+        db = SessionLocal()
+        try:
+            import_service = TaskImportService(db)
+            async for batch in ndjson_batches(request.stream()):
+                for result in await run_in_threadpool(import_service.import_batch, batch):
+                    yield json.dumps(result) + "\n"
+        finally:
+            db.close()
+
+    return RequestStreamingResponse(results(), media_type="application/x-ndjson")
 
 
-@router.put("/{task_id}", response_model=TaskSchema)
+@router.put("/{task_id}", response_model=TaskSaved)
 def update_task(
     task_id: int, 
     task: TaskUpdate, 
@@ -133,37 +190,33 @@ def update_task(
     
     # Update task fields
     update_data = task.dict(exclude={"tags", "dependency_ids"}, exclude_unset=True)
+    project_changed = "project_id" in update_data and update_data["project_id"] != db_task.project_id
     for key, value in update_data.items():
         setattr(db_task, key, value)
+    # Invalidate cached release checks that read this task
+    if tags is not None or dependency_ids is not None or RELEASE_CHECK_FIELDS & update_data.keys():
+        db_task.version = Task.version + 1
     
     # Update tags if provided
     if tags is not None:
-        # Clear existing tags
-        db_task.tags = []
-        
-        # Add new tags
-        for tag_name in tags:
-            tag = db.query(Tag).filter(Tag.name == tag_name).first()
-            if not tag:
-                tag = Tag(name=tag_name)
-                db.add(tag)
-                db.flush()
-            db_task.tags.append(tag)
+        set_task_tags(db, db_task.id, tags)
     
     # Update dependencies if provided
+    missing_dependency_ids = []
     if dependency_ids is not None:
-        # Clear existing dependencies
-        db_task.dependencies = []
-        
-        # Add new dependencies
-        for dep_id in dependency_ids:
-            dep_task = db.query(Task).filter(Task.id == dep_id).first()
-            if dep_task:
-                db_task.dependencies.append(dep_task)
+        db.flush()
+        missing_dependency_ids = set_task_dependencies(db, db_task.id, dependency_ids)
+        refresh_dependency_closure(db, [db_task.id])
+    elif project_changed:
+        # Dependencies crossing projects depend on the project of both tasks
+        db.flush()
+        refresh_project_dependencies(db, [db_task.id])
     
     db.commit()
     db.refresh(db_task)
-    return db_task
+    response = TaskSaved.model_validate(db_task, from_attributes=True)
+    response.missing_dependency_ids = missing_dependency_ids
+    return response
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -177,11 +230,31 @@ def delete_task(
     if db_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
+    # Tasks that reached this one lose the paths through it
+    dependents = transitive_dependents(db, task_id)
+    dependents.pop(task_id, None)
     db.delete(db_task)
+    db.flush()
+    refresh_dependency_closure(db, dependents)
     db.commit()
     return None
 
 
+@router.post("/problems", response_model=List[TaskProblems])
+def check_tasks_problems(
+    request: TaskProblemsRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)
+):
+    """Check many release tasks for problems in one pass; unknown task ids are left out."""
+    problems = find_task_problems(db, request.task_ids)
+    return [
+        TaskProblems(task_id=task_id, problems=problems[task_id])
+        for task_id in dict.fromkeys(request.task_ids)
+        if task_id in problems
+    ]
+
+
 @router.get("/{task_id}/problems", response_model=List[TaskProblem])
 def check_task_problems(
     task_id: int,
@@ -189,45 +262,7 @@ def check_task_problems(
     current_user = Depends(get_current_active_user)
 ):
     """Check for problems with a task for release."""
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if task is None:
+    problems = find_task_problems(db, [task_id])
+    if task_id not in problems:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    problems = []
-    
-    # Check for release-related problems
-    if task.is_release_task:
-        # 1. Check dependencies for correct status
-        for dep_task in task.dependencies:
-            if dep_task.status not in ["For Release", "In Release"]:
-                tag_names = [tag.name for tag in dep_task.tags]
-                problems.append(
-                    TaskProblem(
-                        id=dep_task.id,
-                        title=dep_task.title,
-                        status=dep_task.status,
-                        author=dep_task.author,
-                        developer=dep_task.developer,
-                        tags=tag_names,
-                        description=f"Task is in '{dep_task.status}' status, should be 'For Release' or 'In Release'"
-                    )
-                )
-                
-        # 2. Check for dependencies of dependencies not included in release
-        for dep_task in task.dependencies:
-            for nested_dep in dep_task.dependencies:
-                if nested_dep not in task.dependencies and nested_dep != task:
-                    tag_names = [tag.name for tag in nested_dep.tags]
-                    problems.append(
-                        TaskProblem(
-                            id=nested_dep.id,
-                            title=nested_dep.title,
-                            status=nested_dep.status,
-                            author=nested_dep.author,
-                            developer=nested_dep.developer,
-                            tags=tag_names,
-                            description=f"Dependency of task #{dep_task.id} is not included in the release"
-                        )
-                    )
-    
-    return problems 
\ No newline at end of file
+    return problems[task_id]
\ No newline at end of file
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Body, Header, HTTPException, status
+from typing import Dict, Any, Optional
+import hmac
+
+from app.core.config import settings
+from app.services.webhook_ingestion import ingestion_queue, SUPPORTED_EVENTS
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+
+def verify_gitlab_token(token: Optional[str]) -> None:
+    """Check the X-Gitlab-Token header against the configured webhook secret."""
+    if not settings.GITLAB_WEBHOOK_SECRET:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="GitLab webhook secret is not configured")
+    if not token or not hmac.compare_digest(token.encode(), settings.GITLAB_WEBHOOK_SECRET.encode()):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook token")
+
+
+@router.post("/gitlab", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
+def receive_gitlab_event(
+    payload: Dict[str, Any] = Body(...),
+    x_gitlab_token: Optional[str] = Header(None),
+    x_gitlab_event: Optional[str] = Header(None)
+):
+    """Accept a GitLab push, merge request or pipeline event for asynchronous ingestion."""
+    verify_gitlab_token(x_gitlab_token)
+
+    kind = payload.get("object_kind")
+    if kind not in SUPPORTED_EVENTS:
+        return {"accepted": False, "message": f"Unsupported event '{x_gitlab_event or kind}'"}
+
+    if not ingestion_queue.submit(kind, payload):
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Ingestion queue is full")
+
+    return {"accepted": True, "message": "Event queued"}
@@ -1,10 +1,14 @@
 from app.schemas.project import Project, ProjectCreate, ProjectUpdate
 from app.schemas.branch import Branch, BranchCreate, BranchUpdate
-from app.schemas.task import Task, TaskCreate, TaskUpdate, TaskDetail, TaskProblem, Tag
+from app.schemas.task import (
+    Task, TaskCreate, TaskUpdate, TaskDetail, TaskProblem, TaskProblems, TaskProblemsRequest, TaskSaved, Tag
+)
 from app.schemas.release import (
     Release, ReleaseCreate, ReleaseUpdate, ReleaseCheck, ReleaseAssemblyResponse, 
     ReleaseBranchResponse, ReleaseTaskCheck, ReleaseWithChecks, 
-    ReleaseTaskDependencyCheck, ReleaseCommitCheck, CheckStatusEnum, ReleaseStatusEnum
+    ReleaseTaskDependencyCheck, ReleaseCommitCheck, CheckStatusEnum, ReleaseStatusEnum,
+    ReleaseJob, ReleaseJobStatusEnum, ReleaseChecksPreview,
+    ReleaseTasksAdd, ReleaseTaskAddResult, ReleaseTasksAddResponse
 )
 from app.schemas.commit import Commit, CommitCreate, CommitUpdate, CommitDiff
 from app.schemas.merge_request import MergeRequest, MergeRequestCreate, MergeRequestUpdate, MergeRequestStatusEnum 
\ No newline at end of file
@@ -20,6 +20,9 @@ class MergeRequestBase(BaseModel):
     target_branch: str
     can_be_merged: bool = False
     assigned_to: Optional[str] = None
+    iid: Optional[int] = None
+    project_id: Optional[int] = None
+    pipeline_status: Optional[str] = None
     task_id: Optional[int] = None
     release_id: Optional[int] = None
 
@@ -6,6 +6,8 @@ from datetime import datetime
 class ProjectBase(BaseModel):
     name: str
     description: Optional[str] = None
+    gitlab_project_id: Optional[str] = None
+    youtrack_project_id: Optional[str] = None
 
 
 class ProjectCreate(ProjectBase):
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
+import json
 
 from app.models.release import ReleaseStatus
 
@@ -13,6 +14,13 @@ class ReleaseStatusEnum(str, Enum):
     FAILED = "failed"
 
 
+class ReleaseJobStatusEnum(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
 class CheckStatusEnum(str, Enum):
     SUCCESS = "success"
     WARNING = "warning" 
@@ -24,11 +32,15 @@ class ReleaseBase(BaseModel):
     description: Optional[str] = None
     project_id: int
     branch_id: Optional[int] = None
+    source_branch_id: Optional[int] = None
+    release_task_id: Optional[int] = None
     skip_pipeline: bool = False
 
 
 class ReleaseCreate(ReleaseBase):
-    pass
+    source_branch_id: int
+    release_task_id: int
+    source_branch_name: Optional[str] = None  # resolved from source_branch_id if omitted
 
 
 class ReleaseUpdate(ReleaseBase):
@@ -42,7 +54,8 @@ class ReleaseCheckBase(BaseModel):
     check_type: str
     status: str
     message: Optional[str] = None
-    details: Optional[str] = None
+    details: Optional[Any] = None
+    duration_ms: Optional[float] = None
 
 
 class ReleaseCheckCreate(ReleaseCheckBase):
@@ -66,6 +79,11 @@ class ReleaseInDB(ReleaseBase):
     status: ReleaseStatusEnum
     created_at: datetime
     updated_at: datetime
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def status_value(cls, value):
+        return getattr(value, "value", value)
     
     class Config:
         orm_mode = True
@@ -96,6 +114,53 @@ class ReleaseAssemblyResponse(BaseModel):
     checks: List[Dict[str, Any]] = []
 
 
+class ReleaseTasksAdd(BaseModel):
+    task_ids: List[int] = Field(..., min_length=1, max_length=5000)
+
+
+class ReleaseTaskAddResult(BaseModel):
+    task_id: int
+    success: bool
+    message: str
+
+
+class ReleaseTasksAddResponse(BaseModel):
+    release_id: int
+    added: int
+    results: List[ReleaseTaskAddResult] = []
+
+
+class ReleaseChecksPreview(BaseModel):
+    release_task_id: int
+    checks: List[Dict[str, Any]] = []
+    recomputed: List[str] = []  # check types whose cached result was stale
+
+
+class ReleaseJob(BaseModel):
+    id: int
+    status: ReleaseJobStatusEnum
+    project_id: int
+    release_id: Optional[int] = None
+    result: Optional[ReleaseAssemblyResponse] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def status_value(cls, value):
+        return getattr(value, "value", value)
+
+    @field_validator("result", mode="before")
+    @classmethod
+    def parse_result(cls, value):
+        return json.loads(value) if isinstance(value, str) else value
+
+    class Config:
+        orm_mode = True
+
+
 class ReleaseBranchResponse(BaseModel):
     success: bool
     message: str
@@ -109,6 +174,9 @@ class ReleaseTaskDependencyCheck(BaseModel):
     dependency_id: int
     dependency_title: str
     in_release: bool
+    depth: int = 1
+    chain: List[int] = []  # task ids from task_id to dependency_id
+    is_cycle: bool = False
 
 
 class ReleaseCommitCheck(BaseModel):
@@ -29,6 +29,7 @@ class Tag(TagInDB):
 class TaskBase(BaseModel):
     title: str
     description: Optional[str] = None
+    youtrack_id: Optional[str] = None
     status: str
     author: Optional[str] = None
     developer: Optional[str] = None
@@ -64,6 +65,10 @@ class Task(TaskInDB):
     pass
 
 
+class TaskSaved(Task):
+    missing_dependency_ids: List[int] = []  # requested dependencies that do not exist
+
+
 class TaskWithRelations(TaskInDB):
     tags: List[Tag] = []
     dependencies: List["TaskWithRelations"] = []
@@ -86,4 +91,13 @@ class TaskProblem(BaseModel):
     description: Optional[str] = None
     
     class Config:
-        orm_mode = True 
\ No newline at end of file
+        orm_mode = True
+
+
+class TaskProblems(BaseModel):
+    task_id: int
+    problems: List[TaskProblem] = []
+
+
+class TaskProblemsRequest(BaseModel):
+    task_ids: List[int] = Field(..., min_length=1, max_length=1000)
\ No newline at end of file
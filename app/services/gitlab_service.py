@@ -1,6 +1,21 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterator, Mapping, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import httpx
 import requests
 from app.core.config import settings
+from app.services.http_client import get_http_client, get_async_http_client, gather_bounded
+from app.services.http_cache import get_response_cache, cache_key
+from app.services.singleflight import flights, async_flights
+
+
+def _next_link(headers: Mapping[str, str]) -> Optional[str]:
+    """Extract the rel="next" URL from a Link header"""
+    for link in requests.utils.parse_header_links(headers.get("Link", "")):
+        if link.get("rel") == "next":
+            return link.get("url")
+    return None
+
 
 class GitLabService:
     def __init__(self):
@@ -10,24 +25,141 @@ class GitLabService:
             "PRIVATE-TOKEN": self.token,
             "Content-Type": "application/json"
         }
+        self.client = get_http_client()
+        self.cache = get_response_cache()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> requests.Response:
+        """Send a request over the shared connection pool and check the status"""
+        response = self.client.request(
+            method,
+            url,
+            headers={**self.headers, **(headers or {})},
+            **kwargs
+        )
+        response.raise_for_status()
+        return response
+
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        cached: bool = False
+    ) -> Tuple[Any, Mapping[str, str]]:
+        """GET a resource, sharing one upstream call between identical concurrent requests"""
+        return flights.do(cache_key(url, params), lambda: self._fetch(url, params, cached))
+
+    def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        cached: bool = False
+    ) -> Tuple[Any, Mapping[str, str]]:
+        """GET a resource, optionally through the conditional response cache"""
+        if not cached or self.cache is None:
+            response = self._send("GET", url, params=params)
+            return response.json(), response.headers
+        entry = self.cache.fetch(
+            cache_key(url, params),
+            lambda conditional_headers: self._send("GET", url, headers=conditional_headers, params=params)
+        )
+        return entry.body, entry.headers
+
+    def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request to the GitLab API and return the decoded body"""
+        return self._send(method, f"{self.base_url}/api/v4{path}", **kwargs).json()
+
+    def _paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = 100,
+        prefetch: int = 0,
+        cached: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield items of a list endpoint page by page.
+
+        Follows the `Link: rel="next"` header (used by both keyset and offset
+        pagination) and falls back to `X-Next-Page`. With `prefetch` > 0 and an
+        `X-Total-Pages` header, up to `prefetch` following pages are fetched in
+        parallel; items are still yielded in page order.
+        """
+        url = f"{self.base_url}/api/v4{path}"
+        params = {**(params or {}), "per_page": per_page}
+        items, headers = self._get(url, params=params, cached=cached)
+        yield from items
+
+        # Keyset pagination never reports totals, so prefetch only applies to offset pages
+        total_pages = int(headers.get("X-Total-Pages") or 0)
+        if prefetch > 0 and total_pages > 1:
+            yield from self._prefetch_pages(url, params, 2, total_pages, prefetch, cached)
+            return
+
+        while True:
+            next_url = _next_link(headers)
+            if next_url:
+                items, headers = self._get(next_url, cached=cached)
+            elif headers.get("X-Next-Page"):
+                params["page"] = headers["X-Next-Page"]
+                items, headers = self._get(url, params=params, cached=cached)
+            else:
+                return
+            yield from items
+
+    def _prefetch_pages(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        first_page: int,
+        last_page: int,
+        window: int,
+        cached: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch pages [first_page, last_page] keeping at most `window` requests in flight"""
+        def fetch(page: int) -> List[Dict[str, Any]]:
+            return self._get(url, params={**params, "page": page}, cached=cached)[0]
+
+        pages = iter(range(first_page, last_page + 1))
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            pending = deque(executor.submit(fetch, page) for _, page in zip(range(window), pages))
+            while pending:
+                items = pending.popleft().result()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append(executor.submit(fetch, next_page))
+                yield from items
 
     def get_project(self, project_id: str) -> Dict[str, Any]:
         """Get project details from GitLab"""
-        response = requests.get(
-            f"{self.base_url}/api/v4/projects/{project_id}",
-            headers=self.headers
+        return self._get(f"{self.base_url}/api/v4/projects/{project_id}", cached=True)[0]
+
+    def iter_branches(self, project_id: str, per_page: int = 100, prefetch: int = 0) -> Iterator[Dict[str, Any]]:
+        """Stream all branches for a project across pages"""
+        return self._paginate(
+            f"/projects/{project_id}/repository/branches",
+            per_page=per_page,
+            prefetch=prefetch,
+            cached=True
         )
-        response.raise_for_status()
-        return response.json()
 
     def get_branches(self, project_id: str) -> List[Dict[str, Any]]:
         """Get all branches for a project"""
-        response = requests.get(
-            f"{self.base_url}/api/v4/projects/{project_id}/repository/branches",
-            headers=self.headers
-        )
-        response.raise_for_status()
-        return response.json()
+        return list(self.iter_branches(project_id))
+
+    def get_branch(self, project_id: str, branch_name: str) -> Dict[str, Any]:
+        """Get a single branch, including the SHA of its head commit"""
+        branch = requests.utils.quote(branch_name, safe="")
+        return self._get(f"{self.base_url}/api/v4/projects/{project_id}/repository/branches/{branch}", cached=True)[0]
+
+    def compare(self, project_id: str, from_ref: str, to_ref: str) -> Dict[str, Any]:
+        """Compare two refs; `commits` lists the commits reachable from `to_ref` but not from `from_ref`"""
+        params = {"from": from_ref, "to": to_ref}
+        return self._get(f"{self.base_url}/api/v4/projects/{project_id}/repository/compare", params=params)[0]
 
     def create_branch(self, project_id: str, branch_name: str, ref: str) -> Dict[str, Any]:
         """Create a new branch in the project"""
@@ -35,13 +167,11 @@ class GitLabService:
             "branch": branch_name,
             "ref": ref
         }
-        response = requests.post(
-            f"{self.base_url}/api/v4/projects/{project_id}/repository/branches",
-            headers=self.headers,
+        return self._request(
+            "POST",
+            f"/projects/{project_id}/repository/branches",
             json=data
         )
-        response.raise_for_status()
-        return response.json()
 
     def create_merge_request(
         self,
@@ -58,30 +188,164 @@ class GitLabService:
             "title": title,
             "description": description
         }
-        response = requests.post(
-            f"{self.base_url}/api/v4/projects/{project_id}/merge_requests",
-            headers=self.headers,
+        return self._request(
+            "POST",
+            f"/projects/{project_id}/merge_requests",
             json=data
         )
-        response.raise_for_status()
-        return response.json()
+
+    def iter_merge_requests(
+        self,
+        project_id: str,
+        state: str = "opened",
+        per_page: int = 100,
+        prefetch: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream merge requests for a project across pages"""
+        params = {"state": state}
+        return self._paginate(
+            f"/projects/{project_id}/merge_requests",
+            params=params,
+            per_page=per_page,
+            prefetch=prefetch
+        )
 
     def get_merge_requests(self, project_id: str, state: str = "opened") -> List[Dict[str, Any]]:
         """Get merge requests for a project"""
-        params = {"state": state}
-        response = requests.get(
-            f"{self.base_url}/api/v4/projects/{project_id}/merge_requests",
+        return list(self.iter_merge_requests(project_id, state=state))
+
+    def accept_merge_request(self, project_id: str, merge_request_iid: int) -> Dict[str, Any]:
+        """Accept a merge request"""
+        return self._request(
+            "PUT",
+            f"/projects/{project_id}/merge_requests/{merge_request_iid}/merge"
+        ) 
+
+
+class AsyncGitLabService:
+    """Asyncio version of GitLabService for concurrent fan-out."""
+
+    def __init__(self, concurrency: int = settings.HTTP_MAX_CONCURRENCY):
+        self.base_url = settings.GITLAB_URL
+        self.token = settings.GITLAB_TOKEN
+        self.headers = {
+            "PRIVATE-TOKEN": self.token,
+            "Content-Type": "application/json"
+        }
+        self.concurrency = concurrency
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request to the GitLab API and return the decoded body"""
+        url = f"{self.base_url}/api/v4{path}"
+        if method == "GET":
+            return (await self._get(url, params=kwargs.get("params")))[0]
+        return (await self._send(method, url, **kwargs)).json()
+
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Mapping[str, str]]:
+        """GET a resource, sharing one upstream call between identical concurrent requests"""
+        return await async_flights.do(cache_key(url, params), lambda: self._fetch(url, params))
+
+    async def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Mapping[str, str]]:
+        response = await self._send("GET", url, params=params)
+        return response.json(), response.headers
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request over the shared async connection pool and check the status"""
+        response = await get_async_http_client().request(
+            method,
+            url,
             headers=self.headers,
-            params=params
+            **kwargs
         )
         response.raise_for_status()
-        return response.json()
+        return response
 
-    def accept_merge_request(self, project_id: str, merge_request_iid: int) -> Dict[str, Any]:
+    async def _paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield items of a list endpoint page by page, like GitLabService._paginate without prefetch"""
+        url = f"{self.base_url}/api/v4{path}"
+        params = {**(params or {}), "per_page": per_page}
+        items, headers = await self._get(url, params=params)
+        for item in items:
+            yield item
+
+        while True:
+            next_url = _next_link(headers)
+            if next_url:
+                items, headers = await self._get(next_url)
+            elif headers.get("X-Next-Page"):
+                params["page"] = headers["X-Next-Page"]
+                items, headers = await self._get(url, params=params)
+            else:
+                return
+            for item in items:
+                yield item
+
+    async def get_project(self, project_id: str) -> Dict[str, Any]:
+        """Get project details from GitLab"""
+        return await self._request("GET", f"/projects/{project_id}")
+
+    def iter_branches(self, project_id: str, per_page: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all branches for a project across pages"""
+        return self._paginate(f"/projects/{project_id}/repository/branches", per_page=per_page)
+
+    async def get_branches(self, project_id: str) -> List[Dict[str, Any]]:
+        """Get all branches for a project"""
+        return [branch async for branch in self.iter_branches(project_id)]
+
+    async def create_branch(self, project_id: str, branch_name: str, ref: str) -> Dict[str, Any]:
+        """Create a new branch in the project"""
+        data = {
+            "branch": branch_name,
+            "ref": ref
+        }
+        return await self._request("POST", f"/projects/{project_id}/repository/branches", json=data)
+
+    async def create_merge_request(
+        self,
+        project_id: str,
+        source_branch: str,
+        target_branch: str,
+        title: str,
+        description: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a merge request"""
+        data = {
+            "source_branch": source_branch,
+            "target_branch": target_branch,
+            "title": title,
+            "description": description
+        }
+        return await self._request("POST", f"/projects/{project_id}/merge_requests", json=data)
+
+    def iter_merge_requests(
+        self,
+        project_id: str,
+        state: str = "opened",
+        per_page: int = 100
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream merge requests for a project across pages"""
+        params = {"state": state}
+        return self._paginate(f"/projects/{project_id}/merge_requests", params=params, per_page=per_page)
+
+    async def get_merge_requests(self, project_id: str, state: str = "opened") -> List[Dict[str, Any]]:
+        """Get merge requests for a project"""
+        return [merge_request async for merge_request in self.iter_merge_requests(project_id, state=state)]
+
+    async def accept_merge_request(self, project_id: str, merge_request_iid: int) -> Dict[str, Any]:
         """Accept a merge request"""
-        response = requests.put(
-            f"{self.base_url}/api/v4/projects/{project_id}/merge_requests/{merge_request_iid}/merge",
-            headers=self.headers
+        return await self._request(
+            "PUT",
+            f"/projects/{project_id}/merge_requests/{merge_request_iid}/merge"
         )
-        response.raise_for_status()
-        return response.json() 
\ No newline at end of file
+
+    async def get_projects(self, project_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several projects concurrently, at most `concurrency` requests at a time"""
+        return await gather_bounded(
+            (self.get_project(project_id) for project_id in project_ids),
+            limit=self.concurrency
+        )
\ No newline at end of file
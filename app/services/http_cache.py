@@ -0,0 +1,203 @@
+from typing import Any, Callable, Dict, Mapping, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from urllib.parse import urlencode
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from app.core.config import settings
+
+# Response headers worth keeping: validators and pagination
+STORED_HEADERS = ("ETag", "Last-Modified", "Link", "X-Next-Page", "X-Total-Pages", "X-Total")
+
+
+@dataclass
+class CachedResponse:
+    body: Any
+    headers: Dict[str, str]
+    stored_at: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("Last-Modified")
+
+
+def cache_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Build a stable cache key from the URL and query parameters."""
+    if not params:
+        return url
+    items = sorted((k, v) for k, v in params.items() if v is not None)
+    return f"{url}?{urlencode(items)}"
+
+
+class SQLiteCacheBackend:
+    """On-disk cache tier so cached responses survive restarts."""
+
+    def __init__(self, path: str, max_entries: int = settings.HTTP_CACHE_DISK_MAX_ENTRIES):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_http_cache_last_access ON http_cache (last_access)")
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM http_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE http_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return CachedResponse(**json.loads(row[0]))
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache (key, value, last_access) VALUES (?, ?, ?)",
+                (key, json.dumps(asdict(entry)), time.time())
+            )
+            self._size = self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+            if self._size > self.max_entries:
+                # Drop least recently used rows
+                self._conn.execute(
+                    "DELETE FROM http_cache WHERE key IN "
+                    "(SELECT key FROM http_cache ORDER BY last_access ASC LIMIT ?)",
+                    (self._size - self.max_entries,)
+                )
+                self._size = self.max_entries
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """LRU + TTL cache of GET responses revalidated with ETag / Last-Modified.
+
+    Entries younger than `ttl` seconds are served without contacting the
+    upstream. Older entries are revalidated with If-None-Match /
+    If-Modified-Since, and a 304 answer refreshes them in place.
+    """
+
+    def __init__(
+        self,
+        ttl: float = settings.HTTP_CACHE_TTL,
+        max_entries: int = settings.HTTP_CACHE_MAX_ENTRIES,
+        backend: Optional[SQLiteCacheBackend] = None
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.backend = backend
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.backend is not None:
+            entry = self.backend.get(key)
+            if entry is not None:
+                self._remember(key, entry)
+            return entry
+        return None
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        self._remember(key, entry)
+        if self.backend is not None:
+            self.backend.set(key, entry)
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def fetch(self, key: str, send: Callable[[Dict[str, str]], Any]) -> CachedResponse:
+        """Return a cached response, revalidating or fetching it as needed.
+
+        `send` receives the conditional headers to add and must return a
+        response object (status_code, headers, json()) with errors already raised.
+        """
+        entry = self.get(key)
+        now = time.time()
+        if entry is not None and now - entry.stored_at < self.ttl:
+            self._count("hits")
+            return entry
+
+        conditional_headers = {}
+        if entry is not None:
+            if entry.etag:
+                conditional_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                conditional_headers["If-Modified-Since"] = entry.last_modified
+
+        response = send(conditional_headers)
+        if response.status_code == 304 and entry is not None:
+            self._count("revalidated")
+            entry = CachedResponse(body=entry.body, headers=entry.headers, stored_at=now)
+            self.set(key, entry)
+            return entry
+
+        self._count("misses")
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        entry = CachedResponse(body=response.json(), headers=headers, stored_at=now)
+        self.set(key, entry)
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        stats["max_entries"] = self.max_entries
+        stats["ttl"] = self.ttl
+        stats["disk_size"] = len(self.backend) if self.backend is not None else None
+        return stats
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the process-wide response cache, or None when caching is disabled."""
+    global _cache
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                backend = SQLiteCacheBackend(settings.HTTP_CACHE_PATH) if settings.HTTP_CACHE_PATH else None
+                _cache = ResponseCache(backend=backend)
+    return _cache
@@ -0,0 +1,270 @@
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, TypeVar
+from urllib.parse import urlsplit
+import asyncio
+import threading
+import time
+import weakref
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+from app.services.rate_limit import get_scheduler, IDEMPOTENT_METHODS, RETRY_STATUSES
+
+
+class HTTPClient:
+    """Pooled keep-alive HTTP client shared by the integration services."""
+
+    def __init__(
+        self,
+        connect_timeout: float = settings.HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = settings.HTTP_READ_TIMEOUT,
+        pool_connections: int = settings.HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = settings.HTTP_POOL_MAXSIZE,
+        pool_block: bool = settings.HTTP_POOL_BLOCK,
+        max_retries: int = settings.HTTP_MAX_RETRIES
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.pool_maxsize = pool_maxsize
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        self._lock = threading.Lock()
+        self._requests_total = 0
+        self._errors_total = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request over the shared session, applying the default timeouts.
+
+        Requests are paced by the host scheduler; idempotent requests are
+        retried on timeouts, connection errors and retryable statuses.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        scheduler = get_scheduler(urlsplit(url).netloc)
+        retryable = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            delay = scheduler.acquire()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                scheduler.record_error()
+                self._count(error=True)
+                if retryable and attempt < self.max_retries:
+                    time.sleep(scheduler.backoff(attempt))
+                    attempt += 1
+                    continue
+                raise
+            except requests.RequestException:
+                self._count(error=True)
+                raise
+            self._count()
+            scheduler.record_response(response.status_code, response.headers)
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                if retryable or response.status_code == 429:
+                    response.close()
+                    time.sleep(scheduler.backoff(attempt))
+                    attempt += 1
+                    continue
+            return response
+
+    def _count(self, error: bool = False) -> None:
+        with self._lock:
+            self._requests_total += 1
+            if error:
+                self._errors_total += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Report pool usage per upstream host"""
+        pools: List[Dict[str, Any]] = []
+        container = self.adapter.poolmanager.pools
+        for key in container.keys():
+            pool = container.get(key)
+            if pool is None:
+                continue
+            idle_slots = pool.pool.qsize() if pool.pool is not None else 0
+            idle_connections = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool is not None else 0
+            pools.append({
+                "scheme": pool.scheme,
+                "host": pool.host,
+                "port": pool.port,
+                "maxsize": self.pool_maxsize,
+                "in_use": self.pool_maxsize - idle_slots,
+                "idle": idle_connections,
+                "connections_opened": pool.num_connections,
+                "requests": pool.num_requests,
+            })
+        with self._lock:
+            requests_total = self._requests_total
+            errors_total = self._errors_total
+        return {
+            "connect_timeout": self.timeout[0],
+            "read_timeout": self.timeout[1],
+            "requests_total": requests_total,
+            "errors_total": errors_total,
+            "pools": pools,
+        }
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class AsyncHTTPClient:
+    """Asyncio counterpart of HTTPClient with the same per-host connection limit."""
+
+    def __init__(
+        self,
+        connect_timeout: float = settings.HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = settings.HTTP_READ_TIMEOUT,
+        pool_connections: int = settings.HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = settings.HTTP_POOL_MAXSIZE,
+        max_retries: int = settings.HTTP_MAX_RETRIES
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.pool_maxsize = pool_maxsize
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=pool_connections * pool_maxsize,
+                max_keepalive_connections=pool_connections * pool_maxsize
+            )
+        )
+        # httpx only limits connections globally, so the per-host cap is enforced here
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._requests_total = 0
+        self._errors_total = 0
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request with the same pacing and retry rules as HTTPClient"""
+        host = urlsplit(url).netloc
+        scheduler = get_scheduler(host)
+        retryable = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            delay = scheduler.acquire()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                response = await self._send(host, method, url, **kwargs)
+            except httpx.TransportError:
+                scheduler.record_error()
+                if retryable and attempt < self.max_retries:
+                    await asyncio.sleep(scheduler.backoff(attempt))
+                    attempt += 1
+                    continue
+                raise
+            scheduler.record_response(response.status_code, response.headers)
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                if retryable or response.status_code == 429:
+                    await asyncio.sleep(scheduler.backoff(attempt))
+                    attempt += 1
+                    continue
+            return response
+
+    async def _send(self, host: str, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send one request once a per-host slot is free"""
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self.pool_maxsize)
+        async with slots:
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            try:
+                return await self.client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                self._errors_total += 1
+                raise
+            finally:
+                self._in_flight[host] -= 1
+                self._requests_total += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests_total": self._requests_total,
+            "errors_total": self._errors_total,
+            "hosts": [
+                {"host": host, "maxsize": self.pool_maxsize, "in_use": in_flight}
+                for host, in_flight in self._in_flight.items()
+            ],
+        }
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+_client: Optional[HTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """Return the process-wide HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HTTPClient()
+    return _client
+
+
+def close_http_client() -> None:
+    """Close pooled connections (called on application shutdown)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+# One async client per event loop: httpx connections cannot be shared across loops
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHTTPClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_http_client() -> AsyncHTTPClient:
+    """Return the async HTTP client bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncHTTPClient()
+    return client
+
+
+async def close_async_http_client() -> None:
+    """Close the async client of the running event loop, if any."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def async_http_stats() -> List[Dict[str, Any]]:
+    return [client.stats() for client in list(_async_clients.values())]
+
+
+T = TypeVar("T")
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[T]],
+    limit: int = settings.HTTP_MAX_CONCURRENCY,
+    return_exceptions: bool = False
+) -> List[T]:
+    """Await many coroutines with at most `limit` of them running at once.
+
+    Results are returned in input order, like asyncio.gather.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
@@ -0,0 +1,203 @@
+from typing import Any, Dict, List, Mapping, Optional
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+
+from app.core.config import settings
+from app.core.exceptions import CircuitOpenError, RateLimitExceededError
+
+# Methods that are safe to send again after a failure
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+# Statuses worth retrying; 429 is retried for any method since the request was not processed
+RETRY_STATUSES = {429, 502, 503, 504}
+# Start spacing requests once less than this share of the window is left
+PACING_THRESHOLD = 0.1
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Seconds to wait according to a Retry-After header (delta or HTTP date)."""
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    try:
+        return int(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class HostScheduler:
+    """Per-host pacing, retry backoff and circuit breaker for outbound calls.
+
+    Pacing follows the GitLab `RateLimit-*` headers: once the remaining
+    budget drops below PACING_THRESHOLD the rest of the window is spread
+    evenly, and a 429 / exhausted budget holds all callers until the reset.
+    The breaker opens after `failure_threshold` consecutive failures (5xx,
+    timeouts, connection errors) and lets one probe through after
+    `reset_timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = settings.HTTP_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = settings.HTTP_CIRCUIT_RESET_TIMEOUT,
+        max_wait: float = settings.HTTP_RATE_LIMIT_MAX_WAIT,
+        backoff_base: float = settings.HTTP_BACKOFF_BASE,
+        backoff_max: float = settings.HTTP_BACKOFF_MAX
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_wait = max_wait
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self._next_allowed_at = 0.0
+        self._interval = 0.0
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+        self._rate_limit: Optional[int] = None
+        self._rate_remaining: Optional[int] = None
+        self._stats = {"requests": 0, "throttled": 0, "retries": 0, "rejected": 0, "failures": 0}
+
+    def acquire(self) -> float:
+        """Reserve a send slot and return how long to sleep before sending.
+
+        Raises CircuitOpenError while the breaker is open and
+        RateLimitExceededError if the wait would exceed `max_wait`.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._state == OPEN:
+                retry_in = self._opened_at + self.reset_timeout - now
+                if retry_in > 0:
+                    self._stats["rejected"] += 1
+                    raise CircuitOpenError(self.host, retry_in)
+                self._state = HALF_OPEN
+                self._probe_started_at = None
+            if self._state == HALF_OPEN:
+                probe_running = (
+                    self._probe_started_at is not None
+                    and now - self._probe_started_at < self.reset_timeout
+                )
+                if probe_running:
+                    self._stats["rejected"] += 1
+                    raise CircuitOpenError(self.host, self.reset_timeout)
+                self._probe_started_at = now
+
+            start = max(now, self._next_allowed_at)
+            delay = start - now
+            if delay > self.max_wait:
+                self._stats["rejected"] += 1
+                raise RateLimitExceededError(self.host, delay)
+            self._next_allowed_at = start + self._interval
+            self._stats["requests"] += 1
+            if delay > 0:
+                self._stats["throttled"] += 1
+            return delay
+
+    def record_response(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Update pacing from rate-limit headers and the breaker from the status."""
+        with self._lock:
+            now = time.monotonic()
+            limit = _header_int(headers, "RateLimit-Limit")
+            remaining = _header_int(headers, "RateLimit-Remaining")
+            reset_at = _header_int(headers, "RateLimit-Reset")
+            reset_in = reset_at - time.time() if reset_at is not None else None
+            retry_after = parse_retry_after(headers)
+            self._rate_limit = limit if limit is not None else self._rate_limit
+            self._rate_remaining = remaining
+
+            if status_code == 429 or remaining == 0:
+                wait = retry_after if retry_after is not None else reset_in
+                self._next_allowed_at = max(self._next_allowed_at, now + (wait if wait is not None else self.backoff_base))
+            elif remaining is not None and reset_in is not None and reset_in > 0:
+                low = remaining < (limit * PACING_THRESHOLD if limit else 10)
+                self._interval = reset_in / remaining if low else 0.0
+            else:
+                self._interval = 0.0
+
+            if status_code >= 500:
+                self._record_failure(now)
+            elif status_code == 429:
+                # Throttling says nothing about upstream health
+                self._probe_started_at = None
+            else:
+                self._record_success()
+
+    def record_error(self) -> None:
+        """Count a timeout or connection error towards opening the breaker."""
+        with self._lock:
+            self._record_failure(time.monotonic())
+
+    def _record_failure(self, now: float) -> None:
+        self._stats["failures"] += 1
+        self._failures += 1
+        self._probe_started_at = None
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = OPEN
+            self._opened_at = now
+
+    def _record_success(self) -> None:
+        self._failures = 0
+        self._probe_started_at = None
+        self._state = CLOSED
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential delay before retry number `attempt` (0-based).
+
+        Waiting for a rate-limit reset is handled by acquire(), so this only
+        spreads retries out.
+        """
+        with self._lock:
+            self._stats["retries"] += 1
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "host": self.host,
+                "circuit": self._state,
+                "consecutive_failures": self._failures,
+                "rate_limit": self._rate_limit,
+                "rate_remaining": self._rate_remaining,
+                "pacing_interval": self._interval,
+                **self._stats,
+            }
+
+
+_schedulers: Dict[str, HostScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(host: str) -> HostScheduler:
+    """Return the scheduler shared by all sync and async calls to `host`."""
+    scheduler = _schedulers.get(host)
+    if scheduler is None:
+        with _schedulers_lock:
+            scheduler = _schedulers.get(host)
+            if scheduler is None:
+                scheduler = _schedulers[host] = HostScheduler(host)
+    return scheduler
+
+
+def scheduler_stats() -> List[Dict[str, Any]]:
+    return [scheduler.stats() for scheduler in list(_schedulers.values())]
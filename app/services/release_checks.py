@@ -0,0 +1,131 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+import logging
+import threading
+import time
+
+from sqlalchemy import select, func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database.session import SessionLocal
+from app.schemas import CheckStatusEnum
+from app.services.release_context import ReleaseAssemblyContext
+
+logger = logging.getLogger(__name__)
+
+QUERY_CANCELED = "57014"  # SQLSTATE raised when statement_timeout fires
+
+# A check gets its own session and the shared, read-only release task graph
+CheckFunction = Callable[[Session, ReleaseAssemblyContext], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ReleaseCheckDefinition:
+    check_type: str
+    run: CheckFunction
+    failure_status: CheckStatusEnum  # reported when the check raises or times out
+    timeout: float  # seconds
+    scope: str  # tasks the result depends on: "direct" dependencies or everything "reachable"
+
+
+@dataclass
+class CheckRun:
+    check_type: str
+    result: Dict[str, Any]
+    duration_ms: float
+    completed: bool  # False if the check raised or timed out; such results are not cached
+
+
+_registry: Dict[str, ReleaseCheckDefinition] = {}
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def register_check(
+    check_type: str,
+    failure_status: CheckStatusEnum = CheckStatusEnum.WARNING,
+    timeout: Optional[float] = None,
+    scope: str = "reachable"
+) -> Callable[[CheckFunction], CheckFunction]:
+    """Decorator adding a release check; checks are reported in registration order."""
+    def decorator(run: CheckFunction) -> CheckFunction:
+        _registry[check_type] = ReleaseCheckDefinition(
+            check_type=check_type,
+            run=run,
+            failure_status=failure_status,
+            timeout=timeout if timeout is not None else settings.RELEASE_CHECK_TIMEOUT,
+            scope=scope
+        )
+        return run
+    return decorator
+
+
+def registered_checks() -> List[ReleaseCheckDefinition]:
+    return list(_registry.values())
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.RELEASE_CHECK_WORKERS, thread_name_prefix="release-check")
+        return _executor
+
+
+def _failed_check(definition: ReleaseCheckDefinition, message: str, duration_ms: float) -> CheckRun:
+    result = {
+        "type": definition.check_type,
+        "status": definition.failure_status,
+        "message": message,
+        "data": []
+    }
+    return CheckRun(definition.check_type, result, duration_ms, False)
+
+
+def _run_check(definition: ReleaseCheckDefinition, context: ReleaseAssemblyContext) -> CheckRun:
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        # Let the database abort the check's queries at the same deadline
+        db.execute(select(func.set_config("statement_timeout", str(int(definition.timeout * 1000)), True)))
+        result = definition.run(db, context)
+        return CheckRun(definition.check_type, result, (time.perf_counter() - started) * 1000, True)
+    except Exception as e:
+        duration_ms = (time.perf_counter() - started) * 1000
+        if isinstance(e, OperationalError) and getattr(e.orig, "pgcode", None) == QUERY_CANCELED:
+            logger.warning(f"Release check {definition.check_type} timed out after {definition.timeout}s")
+            return _failed_check(definition, f"Check timed out after {definition.timeout}s", duration_ms)
+        logger.error(f"Release check {definition.check_type} failed: {e}")
+        return _failed_check(definition, f"Check failed: {e}", duration_ms)
+    finally:
+        db.close()
+
+
+def run_release_checks(context: ReleaseAssemblyContext, check_types: Iterable[str]) -> Dict[str, CheckRun]:
+    """Run the given checks concurrently, each with its own session and timeout.
+
+    A check that raises or exceeds its timeout is reported with its
+    failure status. Its queries are cancelled by the statement timeout; a
+    check stuck elsewhere keeps its worker until it returns, but its result
+    is discarded.
+    """
+    definitions = [_registry[check_type] for check_type in check_types]
+    executor = _get_executor()
+    started = time.monotonic()
+    futures = [(definition, executor.submit(_run_check, definition, context)) for definition in definitions]
+
+    runs = {}
+    for definition, future in futures:
+        remaining = definition.timeout - (time.monotonic() - started)
+        try:
+            run = future.result(timeout=max(remaining, 0))
+        except FutureTimeoutError:
+            future.cancel()
+            logger.warning(f"Release check {definition.check_type} timed out after {definition.timeout}s")
+            run = _failed_check(definition, f"Check timed out after {definition.timeout}s", definition.timeout * 1000)
+        run.result["duration_ms"] = round(run.duration_ms, 1)
+        runs[definition.check_type] = run
+    return runs
\ No newline at end of file
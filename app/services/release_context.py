@@ -0,0 +1,75 @@
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.models import Task
+
+
+@dataclass(frozen=True)
+class TaskSnapshot:
+    """Plain copy of the task fields the release checks read."""
+    id: int
+    title: str
+    status: str
+    author: Optional[str]
+    developer: Optional[str]
+    project_id: Optional[int]
+    tags: Tuple[str, ...] = ()
+    dependency_ids: Tuple[int, ...] = ()
+
+    @classmethod
+    def from_task(cls, task: Task, with_relations: bool = True) -> "TaskSnapshot":
+        return cls(
+            id=task.id,
+            title=task.title,
+            status=task.status,
+            author=task.author,
+            developer=task.developer,
+            project_id=task.project_id,
+            tags=tuple(tag.name for tag in task.tags) if with_relations else (),
+            dependency_ids=tuple(dep.id for dep in task.dependencies) if with_relations else ()
+        )
+
+
+@dataclass
+class ReleaseAssemblyContext:
+    """Release task and its dependency graph, loaded once and shared by all checks.
+
+    `tasks` are the direct dependencies of the release task (the tasks that
+    go into the release); `dependencies` holds every task they depend on.
+    Only plain data is kept, so the context can be used after its session
+    is closed or from other threads.
+    """
+    release_task: TaskSnapshot
+    tasks: List[TaskSnapshot]
+    dependencies: Dict[int, TaskSnapshot]
+
+    @property
+    def task_ids(self) -> Set[int]:
+        return {task.id for task in self.tasks}
+
+    @classmethod
+    def load(cls, db: Session, release_task_id: int) -> Optional["ReleaseAssemblyContext"]:
+        """Load the release task graph with a fixed number of queries, independent of its size."""
+        release_task = db.query(Task).options(
+            selectinload(Task.dependencies).options(
+                selectinload(Task.tags),
+                selectinload(Task.dependencies)
+            )
+        ).filter(Task.id == release_task_id).first()
+        if not release_task:
+            return None
+
+        tasks = [TaskSnapshot.from_task(task) for task in release_task.dependencies]
+        # Second-level tasks: their own tags and dependencies are not loaded
+        dependencies = {
+            dep.id: TaskSnapshot.from_task(dep, with_relations=False)
+            for task in release_task.dependencies
+            for dep in task.dependencies
+        }
+        return cls(
+            release_task=TaskSnapshot.from_task(release_task, with_relations=False),
+            tasks=tasks,
+            dependencies=dependencies
+        )
\ No newline at end of file
@@ -0,0 +1,146 @@
+from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import logging
+import threading
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database.session import SessionLocal
+from app.models import ReleaseJob, ReleaseJobStatus
+from app.schemas import ReleaseCreate
+from app.services.release_service import ReleaseService
+
+logger = logging.getLogger(__name__)
+
+
+class ReleaseJobQueue:
+    """Runs release assembly (checks, branch, GitLab MR) on a worker pool.
+
+    Jobs are persisted in `release_jobs`, so their status survives the
+    request that created them; the pool only carries job ids.
+    """
+
+    def __init__(self, workers: int = settings.RELEASE_JOB_WORKERS):
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "succeeded": 0, "failed": 0, "running": 0}
+
+    def start(self) -> None:
+        """Start the pool and pick up jobs left over from a previous run."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="release-job")
+        self._recover()
+
+    def stop(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def enqueue(self, db: Session, release_data: ReleaseCreate) -> ReleaseJob:
+        """Persist a queued job and hand it to the pool."""
+        job = ReleaseJob(
+            status=ReleaseJobStatus.QUEUED,
+            project_id=release_data.project_id,
+            payload=release_data.json()
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        self._submit(job.id)
+        return job
+
+    def _submit(self, job_id: int) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="release-job")
+            self._executor.submit(self._run, job_id)
+            self._stats["submitted"] += 1
+
+    def _recover(self) -> None:
+        """Requeue jobs that were waiting; fail jobs interrupted mid-run, as they may be half applied."""
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(ReleaseJob)
+                .where(ReleaseJob.status == ReleaseJobStatus.RUNNING)
+                .values(status=ReleaseJobStatus.FAILED, error="Interrupted by restart", finished_at=datetime.utcnow())
+            )
+            db.commit()
+            job_ids = [job_id for job_id, in db.query(ReleaseJob.id).filter(ReleaseJob.status == ReleaseJobStatus.QUEUED)]
+        finally:
+            db.close()
+        for job_id in job_ids:
+            self._submit(job_id)
+
+    def _claim(self, db: Session, job_id: int) -> bool:
+        """Move a job from queued to running; False if another worker got it first."""
+        result = db.execute(
+            update(ReleaseJob)
+            .where(ReleaseJob.id == job_id, ReleaseJob.status == ReleaseJobStatus.QUEUED)
+            .values(status=ReleaseJobStatus.RUNNING, started_at=datetime.utcnow())
+        )
+        db.commit()
+        return result.rowcount == 1
+
+    def _run(self, job_id: int) -> None:
+        db = SessionLocal()
+        try:
+            if not self._claim(db, job_id):
+                return
+            self._count("running", 1)
+            try:
+                succeeded = self._assemble(db, job_id)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Release job {job_id} failed: {e}")
+                self._finish(db, job_id, ReleaseJobStatus.FAILED, error=str(e))
+                succeeded = False
+            finally:
+                self._count("running", -1)
+            self._count("succeeded" if succeeded else "failed", 1)
+        finally:
+            db.close()
+
+    def _assemble(self, db: Session, job_id: int) -> bool:
+        job = db.query(ReleaseJob).filter(ReleaseJob.id == job_id).first()
+        release_data = ReleaseCreate(**json.loads(job.payload))
+        release_service = ReleaseService(db)
+
+        result = release_service.assemble_release(release_data)
+        # Keep the assembly outcome even if the GitLab step below fails
+        job.result = result.json()
+        job.release_id = result.release_id
+        db.commit()
+        if not result.success:
+            self._finish(db, job_id, ReleaseJobStatus.FAILED)
+            return False
+
+        release_service.open_release_merge_request(result.release_id)
+        self._finish(db, job_id, ReleaseJobStatus.SUCCEEDED)
+        return True
+
+    def _finish(self, db: Session, job_id: int, status: ReleaseJobStatus, error: Optional[str] = None) -> None:
+        db.execute(
+            update(ReleaseJob)
+            .where(ReleaseJob.id == job_id)
+            .values(status=status, error=error, finished_at=datetime.utcnow())
+        )
+        db.commit()
+
+    def _count(self, name: str, delta: int) -> None:
+        with self._lock:
+            self._stats[name] += delta
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "workers": self.workers}
+
+
+release_job_queue = ReleaseJobQueue()
\ No newline at end of file
@@ -1,51 +1,95 @@
-from typing import List, Dict, Any, Optional, Tuple
-import json
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Pattern
+from datetime import datetime
 import logging
+import re
+from sqlalchemy import update, func, select, or_, and_, cast, String, Text, literal_column
+from sqlalchemy.dialects.postgresql import insert, aggregate_order_by, JSONPATH
 from sqlalchemy.orm import Session
 
-from app.models import Project, Release, Branch, Task, ReleaseCheck, MergeRequest, Commit
-from app.models.task import TaskStatus
+from app.models import (
+    Project, Release, Branch, Task, ReleaseCheck, ReleaseCheckCache, MergeRequest, Commit, CommitRange
+)
+from app.models.commit import commit_range_commits
+from app.models.task import TaskStatus, task_dependencies, task_dependency_closure, cross_project_dependencies
 from app.models.release import ReleaseStatus
 from app.models.merge_request import MergeRequestStatus
 from app.schemas import (
     ReleaseCreate, ReleaseTaskCheck, ReleaseAssemblyResponse, 
-    ReleaseBranchResponse, ReleaseTaskDependencyCheck, CheckStatusEnum
+    ReleaseBranchResponse, ReleaseTaskDependencyCheck, CheckStatusEnum,
+    ReleaseTaskAddResult, ReleaseTasksAddResponse
 )
+from app.services.gitlab_service import GitLabService
+from app.services.release_context import ReleaseAssemblyContext
+from app.services.release_checks import register_check, registered_checks, run_release_checks
+from app.services.task_graph import dependency_closure
+from app.services.webhook_ingestion import parse_gitlab_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Commits are read from the database in chunks of this size
+COMMIT_SCAN_BATCH_SIZE = 1000
+
+
+def build_issue_key_pattern(keys: Iterable[str]) -> Optional[Pattern]:
+    """One regex matching issue keys with any of the given keys' project prefixes.
+
+    Keys look like "EXP-123"; the pattern captures prefix and number, so
+    a match is checked against the key set with a dict lookup. Matching is
+    case-insensitive because branch names are often lowercase.
+    """
+    prefixes = {key.rsplit("-", 1)[0] for key in keys if "-" in key}
+    if not prefixes:
+        return None
+    alternatives = "|".join(re.escape(prefix) for prefix in sorted(prefixes, key=len, reverse=True))
+    return re.compile(rf"(?<![A-Za-z0-9])({alternatives})-(\d+)(?!\d)", re.IGNORECASE)
+
+
+def find_issue_keys(pattern: Optional[Pattern], *texts: Optional[str]) -> List[str]:
+    """Issue keys found in the texts, normalized to upper case, in order of appearance."""
+    if pattern is None:
+        return []
+    keys = []
+    for text in texts:
+        if text:
+            for prefix, number in pattern.findall(text):
+                key = f"{prefix.upper()}-{number}"
+                if key not in keys:
+                    keys.append(key)
+    return keys
+
+
+# jsonpath filters on the entries of a check's details that record a problem
+# of task {id}; task_status lists every release task, task_dependencies
+# every dependency, with the problem marked in the entry
+CHECK_PROBLEM_FILTERS = {
+    "task_status": "@.task_id == {id} && @.problem != null",
+    "task_dependencies": "(@.task_id == {id} || @.dependency_id == {id}) && (@.in_release == false || @.is_cycle == true)",
+    "project_dependencies": "@.task_id == {id}",
+}
+# Checks registered elsewhere match every entry that mentions the task
+OTHER_CHECK_PROBLEM_FILTER = "@.task_id == {id} || @.dependency_id == {id}"
+
 
 class ReleaseService:
     def __init__(self, db: Session):
         self.db = db
 
-    def check_task_statuses(self, release_task_id: int) -> Tuple[List[ReleaseTaskCheck], bool]:
+    def check_task_statuses(self, context: ReleaseAssemblyContext) -> Tuple[List[ReleaseTaskCheck], bool]:
         """Check if all tasks related to the release task have the correct status."""
-        release_task = self.db.query(Task).filter(Task.id == release_task_id).first()
-        if not release_task:
-            return [], False
-
-        # Get all tasks that are dependencies of the release task
-        tasks = []
-        for task in release_task.dependencies:
-            tasks.append(task)
-
         task_checks = []
         all_valid = True
 
-        for task in tasks:
+        for task in context.tasks:
             is_valid = task.status in [TaskStatus.FOR_RELEASE.value, TaskStatus.IN_RELEASE.value]
             problem = None if is_valid else f"Task is in '{task.status}' status, should be 'For Release' or 'In Release'"
             
-            tag_names = [tag.name for tag in task.tags]
-            
             task_check = ReleaseTaskCheck(
                 task_id=task.id,
                 title=task.title,
                 status=task.status,
                 author=task.author,
                 developer=task.developer,
-                tags=tag_names,
+                tags=list(task.tags),
                 problem=problem
             )
             
@@ -56,30 +100,31 @@ class ReleaseService:
 
         return task_checks, all_valid
 
-    def check_task_dependencies(self, release_task_id: int) -> Tuple[List[ReleaseTaskDependencyCheck], bool]:
-        """Check if all task dependencies are included in the release."""
-        release_task = self.db.query(Task).filter(Task.id == release_task_id).first()
-        if not release_task:
-            return [], False
+    def check_task_dependencies(self, context: ReleaseAssemblyContext) -> Tuple[List[ReleaseTaskDependencyCheck], bool]:
+        """Check if all task dependencies, direct and transitive, are included in the release."""
+        release_tasks = context.task_ids
+        closure = dependency_closure(self.db, release_tasks)
 
-        # Get all tasks that are dependencies of the release task
-        release_tasks = set()
-        for task in release_task.dependencies:
-            release_tasks.add(task.id)
+        titles = {task.id: task.title for task in context.tasks}
+        titles.update((task.id, task.title) for task in context.dependencies.values())
+        unknown = (set(closure.missing) | {task_id for cycle in closure.cycles for task_id in cycle}) - titles.keys()
+        if unknown:
+            titles.update(self.db.query(Task.id, Task.title).filter(Task.id.in_(unknown)).all())
 
         dependency_checks = []
         all_valid = True
 
-        for task in release_task.dependencies:
-            for dep_task in task.dependencies:
-                in_release = dep_task.id in release_tasks
+        for task in context.tasks:
+            for dep_id in task.dependency_ids:
+                in_release = dep_id in release_tasks
                 
                 check = ReleaseTaskDependencyCheck(
                     task_id=task.id,
                     title=task.title,
-                    dependency_id=dep_task.id,
-                    dependency_title=dep_task.title,
-                    in_release=in_release
+                    dependency_id=dep_id,
+                    dependency_title=titles[dep_id],
+                    in_release=in_release,
+                    chain=[task.id, dep_id]
                 )
                 
                 dependency_checks.append(check)
@@ -87,6 +132,33 @@ class ReleaseService:
                 if not in_release:
                     all_valid = False
 
+        # Dependencies of dependencies that are not in the release, with the shortest chain to them
+        for dep_id, path in closure.missing.items():
+            if path.depth > 1:
+                dependency_checks.append(ReleaseTaskDependencyCheck(
+                    task_id=path.task_id,
+                    title=titles[path.task_id],
+                    dependency_id=dep_id,
+                    dependency_title=titles[dep_id],
+                    in_release=False,
+                    depth=path.depth,
+                    chain=list(path.chain)
+                ))
+                all_valid = False
+
+        for cycle in closure.cycles:
+            dependency_checks.append(ReleaseTaskDependencyCheck(
+                task_id=cycle[0],
+                title=titles[cycle[0]],
+                dependency_id=cycle[1],
+                dependency_title=titles[cycle[1]],
+                in_release=cycle[1] in release_tasks,
+                depth=len(cycle) - 1,
+                chain=list(cycle),
+                is_cycle=True
+            ))
+            all_valid = False
+
         return dependency_checks, all_valid
 
     def create_release_branch(
@@ -148,76 +220,250 @@ class ReleaseService:
             branch_name=new_branch.name
         )
 
-    def check_project_dependencies(self, release_task_id: int) -> Tuple[List[Dict[str, Any]], bool]:
-        """Check if tasks have dependencies on other projects."""
-        release_task = self.db.query(Task).filter(Task.id == release_task_id).first()
-        if not release_task:
-            return [], False
+    def check_project_dependencies(self, context: ReleaseAssemblyContext) -> Tuple[List[Dict[str, Any]], bool]:
+        """Check if the release depends on unreleased tasks of other projects.
 
-        # Упрощенная реализация, возвращаем пустой список и True (нет внешних зависимостей)
-        return [], True
+        Reads the cross_project_dependencies rows of the release task, which
+        cover everything it reaches, with a single query.
+        """
+        index = cross_project_dependencies
+        rows = self.db.execute(
+            select(
+                index.c.dependency_id,
+                Task.title,
+                Task.status,
+                index.c.dependency_project_id,
+                Project.name,
+                index.c.depth
+            )
+            .join(Task, Task.id == index.c.dependency_id)
+            .join(Project, Project.id == index.c.dependency_project_id)
+            .where(index.c.task_id == context.release_task.id, Task.status != TaskStatus.DONE.value)
+            .order_by(Project.name, index.c.depth, index.c.dependency_id)
+        ).all()
 
-    def assemble_release(
-        self, 
-        release_data: ReleaseCreate
-    ) -> ReleaseAssemblyResponse:
-        """Assemble a new release by checking tasks and creating branches and MRs."""
-        # 1. Check if all tasks have correct statuses
-        task_checks, all_tasks_valid = self.check_task_statuses(release_data.release_task_id)
-        
-        # 2. Check task dependencies
-        dependency_checks, all_deps_valid = self.check_task_dependencies(release_data.release_task_id)
-        
-        # 3. Check project dependencies
-        project_dep_checks, no_ext_deps = self.check_project_dependencies(release_data.release_task_id)
+        project_dep_checks = [
+            {
+                "task_id": row.dependency_id,
+                "title": row.title,
+                "status": row.status,
+                "project_id": row.dependency_project_id,
+                "project_name": row.name,
+                "depth": row.depth
+            }
+            for row in rows
+        ]
+        return project_dep_checks, not project_dep_checks
 
-        # Prepare checks for the response
-        checks = []
-        
-        # Task status check
-        task_status_check = {
+    def _task_status_check(self, context: ReleaseAssemblyContext) -> Dict[str, Any]:
+        task_checks, all_tasks_valid = self.check_task_statuses(context)
+        return {
             "type": "task_status",
             "status": CheckStatusEnum.SUCCESS if all_tasks_valid else CheckStatusEnum.ERROR,
             "message": "All tasks have correct status" if all_tasks_valid else "Some tasks have incorrect status",
             "data": [check.dict() for check in task_checks]
         }
-        checks.append(task_status_check)
-        
-        # Task dependency check
-        task_dep_check = {
+
+    def _task_dependencies_check(self, context: ReleaseAssemblyContext) -> Dict[str, Any]:
+        dependency_checks, all_deps_valid = self.check_task_dependencies(context)
+        return {
             "type": "task_dependencies",
             "status": CheckStatusEnum.SUCCESS if all_deps_valid else CheckStatusEnum.WARNING,
             "message": "All dependencies included in release" if all_deps_valid else "Some dependencies are missing from release",
             "data": [check.dict() for check in dependency_checks]
         }
-        checks.append(task_dep_check)
-        
-        # Project dependency check
-        project_dep_check = {
+
+    def _project_dependencies_check(self, context: ReleaseAssemblyContext) -> Dict[str, Any]:
+        project_dep_checks, no_ext_deps = self.check_project_dependencies(context)
+        return {
             "type": "project_dependencies",
             "status": CheckStatusEnum.SUCCESS if no_ext_deps else CheckStatusEnum.WARNING,
             "message": "No external dependencies" if no_ext_deps else "Has dependencies on other projects",
             "data": project_dep_checks
         }
-        checks.append(project_dep_check)
+
+    def query_checks(
+        self,
+        check_type: Optional[str] = None,
+        status: Optional[str] = None,
+        task_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> str:
+        """Stored release checks matching the filters, newest first, as a JSON array built by Postgres.
+
+        `task_id` matches checks in which the task had a problem (see
+        CHECK_PROBLEM_FILTERS), with jsonpath queries served by the GIN index
+        on details.
+        """
+        query = select(
+            ReleaseCheck.id,
+            ReleaseCheck.release_id,
+            ReleaseCheck.check_type,
+            ReleaseCheck.status,
+            ReleaseCheck.message,
+            ReleaseCheck.details,
+            ReleaseCheck.duration_ms,
+            ReleaseCheck.created_at
+        )
+        if check_type:
+            query = query.where(ReleaseCheck.check_type == check_type)
+        if status:
+            query = query.where(ReleaseCheck.status == status)
+        if task_id is not None:
+            query = query.where(self._task_problem_filter(int(task_id)))
+        checks = query.order_by(
+            ReleaseCheck.created_at.desc(), ReleaseCheck.id.desc()
+        ).offset(skip).limit(limit).subquery("checks")
+
+        rows = func.json_agg(aggregate_order_by(
+            checks.table_valued(), checks.c.created_at.desc(), checks.c.id.desc()
+        ))
+        return self.db.execute(select(func.coalesce(rows, literal_column("'[]'::json")).cast(Text))).scalar()
+
+    @staticmethod
+    def _task_problem_filter(task_id: int):
+        def has_entry(condition: str):
+            path = f"$[*] ? ({condition.format(id=task_id)})"
+            return ReleaseCheck.details.op("@?")(cast(path, JSONPATH))
+
+        return or_(
+            *(
+                and_(ReleaseCheck.check_type == check_type, has_entry(condition))
+                for check_type, condition in CHECK_PROBLEM_FILTERS.items()
+            ),
+            and_(ReleaseCheck.check_type.not_in(CHECK_PROBLEM_FILTERS), has_entry(OTHER_CHECK_PROBLEM_FILTER))
+        )
+
+    def check_fingerprints(self, release_task_id: int) -> Dict[str, Optional[str]]:
+        """Version fingerprints of the tasks a check may read, keyed by check scope.
+
+        "direct" covers the release task and its direct dependencies;
+        "reachable" covers everything the release task reaches in
+        task_dependency_closure. A fingerprint changes whenever one of those
+        tasks gets a new version or the set of tasks changes.
+        """
+        def fingerprint(task_ids) -> Optional[str]:
+            pairs = Task.id.cast(String) + ":" + Task.version.cast(String)
+            return self.db.query(
+                func.md5(func.string_agg(pairs, aggregate_order_by(literal_column("','"), Task.id)))
+            ).filter(or_(Task.id == release_task_id, Task.id.in_(task_ids))).scalar()
+
+        return {
+            "direct": fingerprint(select(task_dependencies.c.dependency_id).where(
+                task_dependencies.c.task_id == release_task_id
+            )),
+            "reachable": fingerprint(select(task_dependency_closure.c.descendant_id).where(
+                task_dependency_closure.c.ancestor_id == release_task_id
+            ))
+        }
+
+    def run_checks(
+        self,
+        release_task_id: int,
+        use_cache: bool = True
+    ) -> Tuple[Optional[List[Dict[str, Any]]], List[str]]:
+        """Run the registered release checks for a release task, reusing cached results whose fingerprint still matches.
+
+        Stale checks run concurrently (see release_checks). Returns the checks
+        in registration order (None if the release task does not exist) and
+        the types that had to be recomputed.
+        """
+        fingerprints = self.check_fingerprints(release_task_id)
+        if fingerprints["direct"] is None:
+            return None, []
+        definitions = registered_checks()
+
+        cached = {}
+        if use_cache:
+            cached = {
+                entry.check_type: entry
+                for entry in self.db.query(ReleaseCheckCache).filter(
+                    ReleaseCheckCache.release_task_id == release_task_id
+                )
+            }
+        stale = [
+            definition.check_type for definition in definitions
+            if definition.check_type not in cached
+            or cached[definition.check_type].fingerprint != fingerprints[definition.scope]
+        ]
+
+        runs = {}
+        if stale:
+            # Load the release task graph once for all recomputed checks
+            context = ReleaseAssemblyContext.load(self.db, release_task_id)
+            if not context:
+                return None, []
+            runs = run_release_checks(context, stale)
+            rows = [
+                {
+                    "release_task_id": release_task_id,
+                    "check_type": definition.check_type,
+                    "fingerprint": fingerprints[definition.scope],
+                    "status": runs[definition.check_type].result["status"].value,
+                    "message": runs[definition.check_type].result["message"],
+                    "details": runs[definition.check_type].result["data"],
+                    "duration_ms": runs[definition.check_type].duration_ms,
+                    "computed_at": datetime.utcnow()
+                }
+                for definition in definitions
+                if definition.check_type in runs and runs[definition.check_type].completed
+            ]
+            if rows:
+                stmt = insert(ReleaseCheckCache).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[ReleaseCheckCache.release_task_id, ReleaseCheckCache.check_type],
+                    set_={
+                        "fingerprint": stmt.excluded.fingerprint,
+                        "status": stmt.excluded.status,
+                        "message": stmt.excluded.message,
+                        "details": stmt.excluded.details,
+                        "duration_ms": stmt.excluded.duration_ms,
+                        "computed_at": stmt.excluded.computed_at
+                    }
+                )
+                self.db.execute(stmt)
+                self.db.commit()
+
+        checks = []
+        for definition in definitions:
+            if definition.check_type in runs:
+                checks.append({**runs[definition.check_type].result, "cached": False})
+            else:
+                entry = cached[definition.check_type]
+                checks.append({
+                    "type": entry.check_type,
+                    "status": CheckStatusEnum(entry.status),
+                    "message": entry.message,
+                    "data": entry.details if entry.details is not None else [],
+                    "duration_ms": entry.duration_ms,
+                    "cached": True
+                })
+        return checks, stale
+
+    def assemble_release(
+        self, 
+        release_data: ReleaseCreate
+    ) -> ReleaseAssemblyResponse:
+        """Assemble a new release by checking tasks and creating branches and MRs."""
+        # 1-3. Registered checks (task status, task and project dependencies), run concurrently
+        checks, _ = self.run_checks(release_data.release_task_id)
+        if checks is None:
+            return ReleaseAssemblyResponse(
+                success=False,
+                message="Release task not found"
+            )
+        errors = [check for check in checks if check["status"] == CheckStatusEnum.ERROR]
         
         # If there are critical errors, return without creating the release
-        if not all_tasks_valid:
+        if errors:
             return ReleaseAssemblyResponse(
                 success=False,
-                message="Release assembly failed: Some tasks have incorrect status",
+                message=f"Release assembly failed: {errors[0]['message']}",
                 checks=checks
             )
 
         # 4. Create release branch if not exists
-        release_task = self.db.query(Task).filter(Task.id == release_data.release_task_id).first()
-        if not release_task:
-            return ReleaseAssemblyResponse(
-                success=False,
-                message="Release task not found",
-                checks=checks
-            )
-            
         project = self.db.query(Project).filter(Project.id == release_data.project_id).first()
         if not project:
             return ReleaseAssemblyResponse(
@@ -264,13 +510,20 @@ class ReleaseService:
                 check_type=check_data["type"],
                 status=check_data["status"],
                 message=check_data["message"],
-                details=json.dumps(check_data["data"])
+                details=check_data["data"],
+                duration_ms=check_data.get("duration_ms")
             )
             self.db.add(release_check)
             
         # 7. Add tasks to the release
-        for task in release_task.dependencies:
-            task.release_id = new_release.id
+        release_task_ids = select(task_dependencies.c.dependency_id).where(
+            task_dependencies.c.task_id == release_data.release_task_id
+        )
+        self.db.execute(
+            update(Task)
+            .where(Task.id.in_(release_task_ids))
+            .values(release_id=new_release.id)
+        )
             
         # Commit all changes
         self.db.commit()
@@ -283,45 +536,224 @@ class ReleaseService:
             checks=checks
         )
 
+    def open_release_merge_request(self, release_id: int) -> Optional[Dict[str, Any]]:
+        """Push the release branch to GitLab and open its merge request into the default branch."""
+        release = self.db.query(Release).filter(Release.id == release_id).first()
+        if not release or not release.project.gitlab_project_id:
+            return None
+
+        gitlab_project_id = release.project.gitlab_project_id
+        gitlab = GitLabService()
+        target_branch = gitlab.get_project(gitlab_project_id).get("default_branch") or "master"
+        gitlab.create_branch(gitlab_project_id, release.branch.name, ref=release.source_branch.name)
+        merge_request = gitlab.create_merge_request(
+            gitlab_project_id,
+            source_branch=release.branch.name,
+            target_branch=target_branch,
+            title=f"Release {release.name}",
+            description=release.description
+        )
+
+        # The merge_request webhook may have stored the row already
+        stmt = insert(MergeRequest).values(
+            project_id=release.project_id,
+            iid=merge_request["iid"],
+            title=merge_request.get("title") or f"Release {release.name}",
+            description=merge_request.get("description"),
+            source_branch=release.branch.name,
+            target_branch=target_branch,
+            status=MergeRequestStatus.OPEN,
+            release_id=release.id
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_merge_requests_project_iid",
+            set_={"release_id": stmt.excluded.release_id}
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+        return merge_request
+
     def add_task_to_release(
         self, 
         release_id: int, 
         task_id: int
     ) -> Dict[str, Any]:
         """Add a task to an existing release."""
+        result = self.add_tasks_to_release(release_id, [task_id])
+        if result is None:
+            return {"success": False, "message": "Release not found"}
+        task_result = result.results[0]
+        return {"success": task_result.success, "message": task_result.message}
+
+    def add_tasks_to_release(
+        self,
+        release_id: int,
+        task_ids: List[int]
+    ) -> Optional[ReleaseTasksAddResponse]:
+        """Add tasks to an existing release, reporting a result per task.
+
+        Statuses are read with one query and the tasks are assigned with one
+        UPDATE; tasks the UPDATE skipped because they changed meanwhile are
+        read again for their result. None if the release does not exist.
+        """
+        if not self.db.query(Release.id).filter(Release.id == release_id).first():
+            return None
+
+        task_ids = list(dict.fromkeys(task_ids))  # keep request order, drop repeats
+        tasks = {
+            task.id: task
+            for task in self.db.query(Task.id, Task.status, Task.release_id).filter(Task.id.in_(task_ids))
+        }
+        allowed_statuses = [TaskStatus.FOR_RELEASE.value, TaskStatus.IN_RELEASE.value]
+        to_add = [
+            task.id for task in tasks.values()
+            if task.release_id != release_id and task.status in allowed_statuses
+        ]
+
+        added = set()
+        if to_add:
+            # The status condition is repeated so a task changed meanwhile is not added
+            added = set(self.db.execute(
+                update(Task)
+                .where(Task.id.in_(to_add), Task.status.in_(allowed_statuses))
+                .values(release_id=release_id)
+                .returning(Task.id)
+            ).scalars())
+            # Report the state that kept the others out, not the one read before the UPDATE
+            skipped = [task_id for task_id in to_add if task_id not in added]
+            for task_id in skipped:
+                tasks.pop(task_id)
+            if skipped:
+                tasks.update(
+                    (task.id, task)
+                    for task in self.db.query(Task.id, Task.status, Task.release_id).filter(Task.id.in_(skipped))
+                )
+            self.db.commit()
+
+        results = []
+        for task_id in task_ids:
+            task = tasks.get(task_id)
+            if task is None:
+                results.append(ReleaseTaskAddResult(task_id=task_id, success=False, message="Task not found"))
+            elif task.release_id == release_id:
+                results.append(ReleaseTaskAddResult(task_id=task_id, success=True, message="Task is already in the release"))
+            elif task_id in added:
+                results.append(ReleaseTaskAddResult(task_id=task_id, success=True, message="Task added to release successfully"))
+            else:
+                results.append(ReleaseTaskAddResult(
+                    task_id=task_id,
+                    success=False,
+                    message=f"Task status is '{task.status}', should be 'For Release' or 'In Release'"
+                ))
+        return ReleaseTasksAddResponse(release_id=release_id, added=len(added), results=results)
+
+    def get_release_commits(self, release_id: int) -> List[Dict[str, Any]]:
+        """Get all commits that are part of a release.
+
+        The commits are those GitLab's compare returns between the heads of
+        the source branch and the release branch. A compare result is stored
+        per (from_sha, to_sha), so a range is fetched from GitLab only once;
+        releases without a GitLab project fall back to stored commits.
+        """
         release = self.db.query(Release).filter(Release.id == release_id).first()
         if not release:
-            return {"success": False, "message": "Release not found"}
-            
-        task = self.db.query(Task).filter(Task.id == task_id).first()
-        if not task:
-            return {"success": False, "message": "Task not found"}
-            
-        project = self.db.query(Project).filter(Project.id == release.project_id).first()
-        if not project:
-            return {"success": False, "message": "Project not found"}
-            
-        # Check if task already in release
-        if task.release_id == release_id:
-            return {"success": True, "message": "Task is already in the release"}
-            
-        # Check task status
-        if task.status not in [TaskStatus.FOR_RELEASE.value, TaskStatus.IN_RELEASE.value]:
-            return {
-                "success": False, 
-                "message": f"Task status is '{task.status}', should be 'For Release' or 'In Release'"
-            }
-            
-        # Add task to release
-        task.release_id = release_id
-        
+            return []
+
+        commit_range = self._release_commit_range(release)
+        if commit_range is None:
+            commits = self.db.query(Commit).filter(Commit.release_id == release_id).order_by(Commit.id).all()
+            return [self._commit_summary(commit) for commit in commits]
+        return [self._commit_summary(commit) for commit in commit_range.commits]
+
+    def _release_commit_range(self, release: Release) -> Optional[CommitRange]:
+        """Cached compare range between the release's branch heads, fetched from GitLab if missing.
+
+        Returns None if the release has no GitLab project or branches.
+        """
+        project = release.project
+        if not (project and project.gitlab_project_id and release.source_branch and release.branch):
+            return None
+
+        gitlab = GitLabService()
+        from_sha = gitlab.get_branch(project.gitlab_project_id, release.source_branch.name)["commit"]["id"]
+        to_sha = gitlab.get_branch(project.gitlab_project_id, release.branch.name)["commit"]["id"]
+
+        commit_range = self.db.query(CommitRange).filter(
+            CommitRange.project_id == project.id,
+            CommitRange.from_sha == from_sha,
+            CommitRange.to_sha == to_sha
+        ).first()
+        if commit_range is None:
+            comparison = gitlab.compare(project.gitlab_project_id, from_sha, to_sha)
+            commit_range = self._store_commit_range(release, from_sha, to_sha, comparison.get("commits") or [])
+        return commit_range
+
+    def _store_commit_range(
+        self,
+        release: Release,
+        from_sha: str,
+        to_sha: str,
+        commits: List[Dict[str, Any]]
+    ) -> CommitRange:
+        """Upsert the compared commits and record them as the range's content."""
+        commit_ids = {}
+        if commits:
+            stmt = insert(Commit).values([
+                {
+                    "hash": commit["id"],
+                    "message": commit.get("message") or commit.get("title"),
+                    "author": commit.get("author_name"),
+                    "branch_name": release.branch.name,
+                    "release_id": release.id,
+                    "committed_at": parse_gitlab_timestamp(commit.get("committed_date")),
+                    "created_at": datetime.utcnow()
+                }
+                for commit in {commit["id"]: commit for commit in commits}.values()
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Commit.hash],
+                set_={
+                    # keep the release a commit was first assigned to
+                    "release_id": func.coalesce(Commit.release_id, stmt.excluded.release_id),
+                    "branch_name": func.coalesce(Commit.branch_name, stmt.excluded.branch_name),
+                    "author": func.coalesce(Commit.author, stmt.excluded.author),
+                    "message": stmt.excluded.message,
+                    "committed_at": stmt.excluded.committed_at
+                }
+            ).returning(Commit.hash, Commit.id)
+            commit_ids = dict(self.db.execute(stmt).all())
+
+        stmt = insert(CommitRange).values(
+            project_id=release.project_id, from_sha=from_sha, to_sha=to_sha, created_at=datetime.utcnow()
+        ).on_conflict_do_nothing(constraint="uq_commit_ranges_project_shas").returning(CommitRange.id)
+        range_id = self.db.execute(stmt).scalar()
+        # range_id is None if a concurrent request stored the same range first
+        if range_id is not None and commit_ids:
+            positions = {}
+            for position, commit in enumerate(commits):
+                positions.setdefault(commit["id"], position)
+            self.db.execute(insert(commit_range_commits).values([
+                {"range_id": range_id, "commit_id": commit_ids[sha], "position": position}
+                for sha, position in positions.items()
+            ]))
         self.db.commit()
-        return {"success": True, "message": "Task added to release successfully"}
 
-    def get_release_commits(self, release_id: int) -> List[Dict[str, Any]]:
-        """Get all commits that are part of a release."""
-        # TODO возвращаем заглушку
-        return []
+        return self.db.query(CommitRange).filter(
+            CommitRange.project_id == release.project_id,
+            CommitRange.from_sha == from_sha,
+            CommitRange.to_sha == to_sha
+        ).one()
+
+    @staticmethod
+    def _commit_summary(commit: Commit) -> Dict[str, Any]:
+        return {
+            "id": commit.hash[:8],
+            "hash": commit.hash,
+            "message": commit.message,
+            "author": commit.author,
+            "date": commit.committed_at,
+            "branch_name": commit.branch_name
+        }
 
     def compare_tasks_with_commits(self, release_id: int) -> Dict[str, Any]:
         """Compare tasks in the release with commits to ensure all are included."""
@@ -331,19 +763,71 @@ class ReleaseService:
             
         # Получаем задачи релиза
         release_tasks = self.db.query(Task).filter(Task.release_id == release_id).all()
-        
-        # TODO возвращаем упрощенный ответ
+        tasks_by_key = {task.youtrack_id.upper(): task for task in release_tasks if task.youtrack_id}
+        pattern = build_issue_key_pattern(tasks_by_key)
+
+        # Scan the same commits get_release_commits returns: the release's
+        # cached compare range, or stored commits without a GitLab project.
+        # A commit keeps the release it was first stored with, so the range
+        # is read through commit_range_commits rather than Commit.release_id
+        commits = self.db.query(Commit.hash, Commit.message, Commit.author, Commit.branch_name)
+        commit_range = self._release_commit_range(release)
+        if commit_range is None:
+            commits = commits.filter(Commit.release_id == release_id).order_by(Commit.id)
+        else:
+            crc = commit_range_commits
+            commits = commits.join(crc, crc.c.commit_id == Commit.id).filter(
+                crc.c.range_id == commit_range.id
+            ).order_by(crc.c.position)
+        # Stream commits through a server-side cursor instead of loading them all
+        commits = commits.yield_per(COMMIT_SCAN_BATCH_SIZE)
+
+        matched_task_ids = set()
+        unmatched_commits = []
+        scanned = 0
+        for commit in commits:
+            scanned += 1
+            keys = find_issue_keys(pattern, commit.message, commit.branch_name)
+            found = [tasks_by_key[key] for key in keys if key in tasks_by_key]
+            if found:
+                matched_task_ids.update(task.id for task in found)
+            else:
+                unmatched_commits.append({
+                    "id": commit.hash[:8],
+                    "hash": commit.hash,
+                    "message": commit.message,
+                    "author": commit.author,
+                    "branch_name": commit.branch_name,
+                    "issue_keys": keys  # keys of tasks outside the release, if any
+                })
+
+        def task_summary(task: Task) -> Dict[str, Any]:
+            return {"id": task.id, "title": task.title, "status": task.status, "youtrack_id": task.youtrack_id}
+
+        matched_tasks = [task_summary(task) for task in release_tasks if task.id in matched_task_ids]
+        unmatched_tasks = [task_summary(task) for task in release_tasks if task.id not in matched_task_ids]
         return {
             "success": True,
-            "all_match": True,
-            "matched_tasks": [
-                {
-                    "id": task.id,
-                    "title": task.title,
-                    "status": task.status
-                }
-                for task in release_tasks
-            ],
-            "unmatched_tasks": [],
-            "unmatched_commits": []
-        } 
\ No newline at end of file
+            "all_match": not unmatched_tasks and not unmatched_commits,
+            "commits_scanned": scanned,
+            "matched_tasks": matched_tasks,
+            "unmatched_tasks": unmatched_tasks,
+            "unmatched_commits": unmatched_commits
+        }
+
+
+# Built-in release checks, run concurrently by ReleaseService.run_checks
+
+@register_check("task_status", failure_status=CheckStatusEnum.ERROR, scope="direct")
+def run_task_status_check(db: Session, context: ReleaseAssemblyContext) -> Dict[str, Any]:
+    return ReleaseService(db)._task_status_check(context)
+
+
+@register_check("task_dependencies")
+def run_task_dependencies_check(db: Session, context: ReleaseAssemblyContext) -> Dict[str, Any]:
+    return ReleaseService(db)._task_dependencies_check(context)
+
+
+@register_check("project_dependencies")
+def run_project_dependencies_check(db: Session, context: ReleaseAssemblyContext) -> Dict[str, Any]:
+    return ReleaseService(db)._project_dependencies_check(context)
\ No newline at end of file
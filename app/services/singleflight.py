@@ -0,0 +1,117 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+import asyncio
+import threading
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = {"calls": 0, "executed": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self._stats["coalesced"] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._stats["executed"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+class _AsyncCall:
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Asyncio counterpart of SingleFlight; waiters share one awaited call.
+
+    The call runs in its own task, so a cancelled caller (e.g. a client that
+    disconnected) only stops waiting; the others still get the result. The
+    task is cancelled once no caller waits for it any more.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _AsyncCall] = {}
+        self._stats = {"calls": 0, "executed": 0, "coalesced": 0}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        self._stats["calls"] += 1
+        call = self._calls.get(flight_key)
+        if call is not None:
+            self._stats["coalesced"] += 1
+        else:
+            self._stats["executed"] += 1
+            call = self._calls[flight_key] = _AsyncCall(loop.create_task(self._run(flight_key, fn)))
+
+        call.waiters += 1
+        try:
+            # shield: a cancelled waiter must not cancel the shared call
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self._forget(flight_key, call.task)
+                call.task.cancel()
+
+    async def _run(self, flight_key: Tuple[asyncio.AbstractEventLoop, Hashable], fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await fn()
+        finally:
+            self._forget(flight_key, asyncio.current_task())
+
+    def _forget(self, flight_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: Optional["asyncio.Task[Any]"]) -> None:
+        # A cancelled call may finish after a new one took its key
+        call = self._calls.get(flight_key)
+        if call is not None and call.task is task:
+            del self._calls[flight_key]
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "in_flight": len(self._calls)}
+
+
+flights = SingleFlight()
+async_flights = AsyncSingleFlight()
@@ -0,0 +1,60 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Task, Tag
+from app.models.task import task_tags, task_dependencies
+from app.services.task_graph import dependency_subgraph
+
+
+def load_task_detail(db: Session, task_id: int, depth: int) -> Optional[Dict[str, Any]]:
+    """TaskDetail of a task as plain data, with dependencies nested `depth` levels deep.
+
+    The dependency subgraph, the direct dependents, the task rows and their
+    tags are read with four queries whatever the size of the tree; the tree
+    is then built from in-memory maps. Dependent tasks are listed with their
+    tags but without their own dependencies. Returns None if the task does
+    not exist.
+    """
+    edges = dependency_subgraph(db, task_id, depth)
+    td = task_dependencies
+    dependent_ids = list(db.execute(
+        select(td.c.task_id).where(td.c.dependency_id == task_id).order_by(td.c.task_id)
+    ).scalars())
+
+    task_ids = {task_id, *dependent_ids, *edges, *(dep_id for dep_ids in edges.values() for dep_id in dep_ids)}
+    rows = {
+        row["id"]: dict(row)
+        for row in db.execute(select(Task.__table__).where(Task.id.in_(task_ids))).mappings()
+    }
+    if task_id not in rows:
+        return None
+
+    tags: Dict[int, List[Dict[str, Any]]] = {}
+    for tagged_id, tag_id, name in db.execute(
+        select(task_tags.c.task_id, Tag.id, Tag.name)
+        .join(Tag, Tag.id == task_tags.c.tag_id)
+        .where(task_tags.c.task_id.in_(task_ids))
+        .order_by(Tag.name)
+    ):
+        tags.setdefault(tagged_id, []).append({"id": tag_id, "name": name})
+
+    # A task reached along several paths is built once per remaining depth;
+    # the depth bound also ends the recursion on circular dependencies
+    built: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+    def build(node_id: int, remaining: int) -> Dict[str, Any]:
+        key = (node_id, remaining)
+        if key not in built:
+            built[key] = {
+                **rows[node_id],
+                "tags": tags.get(node_id, []),
+                "dependencies": [build(dep_id, remaining - 1) for dep_id in edges.get(node_id, [])] if remaining > 0 else []
+            }
+        return built[key]
+
+    return {
+        **build(task_id, depth),
+        "dependent_tasks": [build(dependent_id, 0) for dependent_id in dependent_ids]
+    }
\ No newline at end of file
@@ -0,0 +1,454 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from collections import deque
+from dataclasses import dataclass, field
+import logging
+import threading
+
+from sqlalchemy import select, literal, delete, func, or_, exists, and_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.database.session import SessionLocal
+from app.models import Task
+from app.models.task import task_dependencies, task_dependency_closure, cross_project_dependencies
+
+logger = logging.getLogger(__name__)
+
+# Set once this process has checked task_dependency_closure against
+# task_dependencies; cleared when a refresh fails
+_closure_verified = threading.Event()
+
+
+@dataclass(frozen=True)
+class DependencyPath:
+    """Dependency chain found from `task_id` to `dependency_id`."""
+    task_id: int
+    dependency_id: int
+    depth: int
+    chain: Tuple[int, ...]  # task_id, ..., dependency_id
+    is_cycle: bool  # dependency_id already appears earlier in the chain
+
+
+@dataclass
+class DependencyClosure:
+    paths: List[DependencyPath]
+    missing: Dict[int, DependencyPath] = field(default_factory=dict)  # dependency outside the set -> shortest chain
+    cycles: List[Tuple[int, ...]] = field(default_factory=list)
+
+
+def dependency_paths(
+    db: Session,
+    root_ids: Iterable[int],
+    stop_ids: Iterable[int] = (),
+    max_depth: int = settings.TASK_DEPENDENCY_MAX_DEPTH
+) -> List[DependencyPath]:
+    """Walk task_dependencies from `root_ids`.
+
+    A path is not extended past a task in `stop_ids` or past `max_depth`.
+    For each (root, dependency) the shortest path is returned, plus one path
+    per cycle found (leading from a root into the cycle and around it once).
+
+    One recursive query collects the reachable tasks with their edges. Its
+    UNION keeps each task once, so the query stays linear in the size of the
+    subgraph however many paths lead through it. The chains are rebuilt in
+    memory from the parent pointers of a breadth-first search from each root.
+    """
+    root_ids = list(dict.fromkeys(root_ids))
+    stop_ids = set(stop_ids)
+    if not root_ids:
+        return []
+
+    td = task_dependencies
+    reach = select(td.c.dependency_id.label("task_id")).where(
+        td.c.task_id.in_(root_ids)
+    ).cte("dependency_reach", recursive=True)
+    step = select(td.c.dependency_id).select_from(reach).join(td, td.c.task_id == reach.c.task_id)
+    if stop_ids:
+        step = step.where(reach.c.task_id.not_in(stop_ids))
+    reach = reach.union(step)
+    sources = select(reach.c.task_id)  # tasks whose own dependencies are walked
+    if stop_ids:
+        sources = sources.where(reach.c.task_id.not_in(stop_ids))
+
+    edges: Dict[int, List[int]] = {}
+    for task_id, dependency_id in db.execute(
+        select(td.c.task_id, td.c.dependency_id)
+        .where(or_(td.c.task_id.in_(root_ids), td.c.task_id.in_(sources)))
+        .order_by(td.c.task_id, td.c.dependency_id)
+    ):
+        edges.setdefault(task_id, []).append(dependency_id)
+
+    paths = []
+    parents: Dict[int, Dict[int, int]] = {}  # root -> task -> task it was first reached from
+
+    def chain(root_id: int, task_id: int) -> Tuple[int, ...]:
+        links = [task_id]
+        while links[-1] != root_id:
+            links.append(parents[root_id][links[-1]])
+        return tuple(reversed(links))
+
+    for root_id in root_ids:
+        parent = parents[root_id] = {}
+        depths = {root_id: 0}
+        queue = deque([root_id])
+        while queue:
+            task_id = queue.popleft()
+            if depths[task_id] >= max_depth or (task_id != root_id and task_id in stop_ids):
+                continue
+            for dependency_id in edges.get(task_id, ()):
+                if dependency_id not in depths:
+                    depths[dependency_id] = depths[task_id] + 1
+                    parent[dependency_id] = task_id
+                    queue.append(dependency_id)
+        paths.extend(
+            DependencyPath(root_id, task_id, depth, chain(root_id, task_id), False)
+            for task_id, depth in depths.items() if task_id != root_id
+        )
+
+    for cycle in _find_cycles({task_id: {dep_id: (task_id, dep_id) for dep_id in deps} for task_id, deps in edges.items()}):
+        start = cycle[0]
+        root_id = start if start in parents else next((r for r in root_ids if start in parents[r]), None)
+        if root_id is None:
+            continue  # only reachable beyond max_depth
+        lead = chain(root_id, start)
+        paths.append(DependencyPath(root_id, start, len(lead) + len(cycle) - 2, lead + cycle[1:], True))
+    return paths
+
+
+def _find_cycles(edges: Dict[int, Dict[int, Tuple[int, ...]]]) -> List[Tuple[int, ...]]:
+    """Cycles in a graph whose edges carry the chain they stand for (iterative DFS, one per back edge)."""
+    cycles = []
+    state: Dict[int, int] = {}  # 1 = on the stack, 2 = done
+    for start in edges:
+        if start in state:
+            continue
+        stack: List[Tuple[int, Iterable[int]]] = [(start, iter(edges.get(start, {})))]
+        on_stack = [start]
+        state[start] = 1
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                on_stack.pop()
+                state[node] = 2
+            elif state.get(child) == 1:
+                members = on_stack[on_stack.index(child):] + [child]
+                chain: Tuple[int, ...] = (child,)
+                for source, target in zip(members, members[1:]):
+                    chain += edges[source][target][1:]
+                cycles.append(chain)
+            elif child not in state:
+                state[child] = 1
+                on_stack.append(child)
+                stack.append((child, iter(edges.get(child, {}))))
+    return cycles
+
+
+def dependency_closure(db: Session, task_ids: Iterable[int]) -> DependencyClosure:
+    """Transitive dependencies of a set of tasks (e.g. a release) missing from the set, and cycles.
+
+    Walks stop at tasks of the set, since each of them is walked on its
+    own; cycles are found over the edges of all the walks together.
+    """
+    members = set(task_ids)
+    if not closure_has_problems(db, members):
+        return DependencyClosure(paths=[])
+    paths = dependency_paths(db, members, stop_ids=members)
+    closure = DependencyClosure(paths=paths)
+
+    seen_cycles: Set[frozenset] = set()
+    for path in paths:
+        if path.is_cycle:
+            cycle = path.chain[path.chain.index(path.dependency_id):]
+            if frozenset(cycle) not in seen_cycles:
+                seen_cycles.add(frozenset(cycle))
+                closure.cycles.append(cycle)
+        elif path.dependency_id not in members:
+            known = closure.missing.get(path.dependency_id)
+            if known is None or path.depth < known.depth:
+                closure.missing[path.dependency_id] = path
+    return closure
+
+
+def closure_is_trusted() -> bool:
+    """Whether task_dependency_closure was checked by this process and no refresh has failed since."""
+    return _closure_verified.is_set()
+
+
+def closure_has_problems(db: Session, task_ids: Iterable[int]) -> bool:
+    """Whether any task of the set reaches a task outside it, or itself, per the closure table.
+
+    Until the table is trusted (see check_dependency_closure) this answers
+    True, so callers walk task_dependencies instead of relying on it.
+    """
+    task_ids = list(task_ids)
+    if not task_ids:
+        return False
+    if not closure_is_trusted():
+        return True
+    closure = task_dependency_closure
+    query = select(closure.c.ancestor_id).where(
+        closure.c.ancestor_id.in_(task_ids),
+        or_(closure.c.descendant_id.not_in(task_ids), closure.c.descendant_id == closure.c.ancestor_id)
+    ).limit(1)
+    return db.execute(query).first() is not None
+
+
+def sets_with_closure_problems(db: Session, task_sets: Dict[int, Set[int]]) -> List[int]:
+    """Keys of the sets in which a task reaches a task outside its set, or itself.
+
+    closure_has_problems for many sets (e.g. releases) with one query;
+    every key is returned while the table is not trusted.
+    """
+    if not closure_is_trusted():
+        return [key for key, task_ids in task_sets.items() if task_ids]
+    all_ids = set().union(*task_sets.values()) if task_sets else set()
+    if not all_ids:
+        return []
+    closure = task_dependency_closure
+    reachable: Dict[int, Set[int]] = {}
+    for ancestor_id, descendant_id in db.execute(
+        select(closure.c.ancestor_id, closure.c.descendant_id).where(closure.c.ancestor_id.in_(all_ids))
+    ):
+        reachable.setdefault(ancestor_id, set()).add(descendant_id)
+
+    return [
+        key for key, task_ids in task_sets.items()
+        if any(
+            task_id in reachable.get(task_id, ()) or not reachable.get(task_id, set()) <= task_ids
+            for task_id in task_ids
+        )
+    ]
+
+
+def transitive_dependents(db: Session, task_id: int) -> Dict[int, int]:
+    """Tasks that depend on `task_id` directly or transitively, mapped to the chain length."""
+    closure = task_dependency_closure
+    return dict(db.execute(
+        select(closure.c.ancestor_id, closure.c.depth).where(closure.c.descendant_id == task_id)
+    ).all())
+
+
+def transitive_dependencies(db: Session, task_id: int) -> Dict[int, int]:
+    """Tasks `task_id` depends on directly or transitively, mapped to the chain length."""
+    closure = task_dependency_closure
+    return dict(db.execute(
+        select(closure.c.descendant_id, closure.c.depth).where(closure.c.ancestor_id == task_id)
+    ).all())
+
+
+def dependency_subgraph(db: Session, task_id: int, depth: int) -> Dict[int, List[int]]:
+    """Direct dependencies of `task_id` and of every task less than `depth` steps away from it.
+
+    This is the part of the graph that a dependency tree `depth` levels deep
+    is drawn from; it is read with one recursive query.
+    """
+    if depth <= 0:
+        return {}
+    td = task_dependencies
+    parents = td.c.task_id == task_id
+    if depth > 1:
+        reach = _reachability([task_id], depth - 1).subquery()
+        parents = or_(parents, td.c.task_id.in_(select(reach.c.descendant_id)))
+    edges: Dict[int, List[int]] = {}
+    for parent_id, dependency_id in db.execute(
+        select(td.c.task_id, td.c.dependency_id).where(parents).order_by(td.c.task_id, td.c.dependency_id)
+    ):
+        edges.setdefault(parent_id, []).append(dependency_id)
+    return edges
+
+
+def _reachability(ancestor_ids: Optional[List[int]], max_depth: int):
+    """SELECT of (ancestor_id, descendant_id, depth) computed from task_dependencies.
+
+    The recursive part uses UNION over (ancestor, descendant, depth), so
+    tasks reached along several paths of the same length are expanded once.
+    """
+    td = task_dependencies
+    base = select(
+        td.c.task_id.label("ancestor_id"),
+        td.c.dependency_id.label("descendant_id"),
+        literal(1).label("depth")
+    )
+    if ancestor_ids is not None:
+        base = base.where(td.c.task_id.in_(ancestor_ids))
+    reach = base.cte("reachability", recursive=True)
+    reach = reach.union(
+        select(reach.c.ancestor_id, td.c.dependency_id, reach.c.depth + 1)
+        .join(td, td.c.task_id == reach.c.descendant_id)
+        .where(reach.c.depth < max_depth)
+    )
+    return select(
+        reach.c.ancestor_id,
+        reach.c.descendant_id,
+        func.min(reach.c.depth).label("depth")
+    ).group_by(reach.c.ancestor_id, reach.c.descendant_id)
+
+
+def refresh_dependency_closure(
+    db: Session,
+    task_ids: Iterable[int],
+    max_depth: int = settings.TASK_DEPENDENCY_MAX_DEPTH
+) -> None:
+    """Recompute the closure rows affected by a change of the dependencies of `task_ids`.
+
+    Call after the task_dependencies rows are flushed. Only the changed
+    tasks and the tasks that reach them are recomputed; the caller commits.
+    """
+    task_ids = list(task_ids)
+    if not task_ids:
+        return
+    closure = task_dependency_closure
+    try:
+        affected = set(task_ids) | set(db.execute(
+            select(closure.c.ancestor_id).where(closure.c.descendant_id.in_(task_ids))
+        ).scalars())
+        affected = list(affected)
+
+        db.execute(delete(closure).where(closure.c.ancestor_id.in_(affected)))
+        db.execute(insert(closure).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            _reachability(affected, max_depth)
+        ))
+        refresh_project_dependencies(db, affected)
+    except Exception:
+        # The caller may still commit the dependency change itself
+        _closure_verified.clear()
+        logger.warning("Task dependency closure refresh failed, dependency checks walk the graph until the next check")
+        raise
+
+
+def _cross_project_pairs(task_ids: Optional[List[int]]):
+    """SELECT of the closure pairs that cross projects, optionally only those touching `task_ids`."""
+    closure = task_dependency_closure
+    ancestor = aliased(Task)
+    descendant = aliased(Task)
+    query = select(
+        closure.c.ancestor_id,
+        closure.c.descendant_id,
+        ancestor.project_id,
+        descendant.project_id,
+        closure.c.depth
+    ).join(ancestor, ancestor.id == closure.c.ancestor_id).join(
+        descendant, descendant.id == closure.c.descendant_id
+    ).where(ancestor.project_id != descendant.project_id)
+    if task_ids is not None:
+        query = query.where(or_(closure.c.ancestor_id.in_(task_ids), closure.c.descendant_id.in_(task_ids)))
+    return query
+
+
+def refresh_project_dependencies(db: Session, task_ids: Iterable[int]) -> None:
+    """Recompute the cross_project_dependencies rows of `task_ids`, as dependent or as dependency.
+
+    Called by refresh_dependency_closure; call it directly after the
+    project of a task changes. The caller commits.
+    """
+    task_ids = list(task_ids)
+    if not task_ids:
+        return
+    index = cross_project_dependencies
+    db.execute(delete(index).where(or_(index.c.task_id.in_(task_ids), index.c.dependency_id.in_(task_ids))))
+    db.execute(insert(index).from_select(
+        ["task_id", "dependency_id", "project_id", "dependency_project_id", "depth"],
+        _cross_project_pairs(task_ids)
+    ))
+
+
+def project_dependencies(db: Session, project_id: int) -> Dict[int, int]:
+    """Projects that tasks of `project_id` depend on, mapped to the number of such task pairs."""
+    index = cross_project_dependencies
+    return dict(db.execute(
+        select(index.c.dependency_project_id, func.count())
+        .where(index.c.project_id == project_id)
+        .group_by(index.c.dependency_project_id)
+    ).all())
+
+
+def rebuild_dependency_closure(db: Session, max_depth: int = settings.TASK_DEPENDENCY_MAX_DEPTH) -> int:
+    """Recompute the whole closure table and the cross-project index (e.g. after a bulk import); returns the closure row count."""
+    closure = task_dependency_closure
+    db.execute(delete(closure))
+    db.execute(insert(closure).from_select(
+        ["ancestor_id", "descendant_id", "depth"],
+        _reachability(None, max_depth)
+    ))
+    db.execute(delete(cross_project_dependencies))
+    db.execute(insert(cross_project_dependencies).from_select(
+        ["task_id", "dependency_id", "project_id", "dependency_project_id", "depth"],
+        _cross_project_pairs(None)
+    ))
+    db.commit()
+    return db.execute(select(func.count()).select_from(closure)).scalar()
+
+
+def verify_dependency_closure(db: Session, max_depth: int = settings.TASK_DEPENDENCY_MAX_DEPTH) -> Dict[str, Any]:
+    """Compare the closure table with a fresh computation from task_dependencies, and the cross-project index with it."""
+    closure = task_dependency_closure
+    expected = _reachability(None, max_depth).subquery("expected")
+
+    missing = select(expected).where(~exists().where(and_(
+        closure.c.ancestor_id == expected.c.ancestor_id,
+        closure.c.descendant_id == expected.c.descendant_id,
+        closure.c.depth == expected.c.depth
+    )))
+    stale = select(closure).where(~exists().where(and_(
+        expected.c.ancestor_id == closure.c.ancestor_id,
+        expected.c.descendant_id == closure.c.descendant_id,
+        expected.c.depth == closure.c.depth
+    )))
+    missing_rows = db.execute(missing.limit(20)).all()
+    stale_rows = db.execute(stale.limit(20)).all()
+
+    # The cross-project index is checked against the closure table itself
+    index = cross_project_dependencies
+    expected_index = _cross_project_pairs(None).except_(select(
+        index.c.task_id, index.c.dependency_id, index.c.project_id, index.c.dependency_project_id, index.c.depth
+    ))
+    actual_index = select(
+        index.c.task_id, index.c.dependency_id, index.c.project_id, index.c.dependency_project_id, index.c.depth
+    ).except_(_cross_project_pairs(None))
+    index_missing_rows = db.execute(expected_index.limit(20)).all()
+    index_stale_rows = db.execute(actual_index.limit(20)).all()
+    return {
+        "consistent": not (missing_rows or stale_rows or index_missing_rows or index_stale_rows),
+        "missing": [tuple(row) for row in missing_rows],  # first rows only
+        "stale": [tuple(row) for row in stale_rows],
+        "project_index_missing": [tuple(row) for row in index_missing_rows],
+        "project_index_stale": [tuple(row) for row in index_stale_rows],
+    }
+
+
+def check_dependency_closure(db: Session) -> Dict[str, Any]:
+    """Verify the closure table, rebuilding it if it disagrees with task_dependencies; run at startup.
+
+    A table filled before the closure existed, or left behind by a write
+    that skipped refresh_dependency_closure, is fixed here. Until this has
+    run, the closure shortcuts are not taken.
+    """
+    result = verify_dependency_closure(db)
+    if not result["consistent"]:
+        logger.warning(f"Task dependency closure is out of date, rebuilding it: {result}")
+        rebuild_dependency_closure(db)
+    _closure_verified.set()
+    return result
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    command = sys.argv[1] if len(sys.argv) > 1 else "verify"
+    db = SessionLocal()
+    try:
+        if command == "rebuild":
+            logger.info(f"Rebuilt task dependency closure: {rebuild_dependency_closure(db)} rows")
+        elif command == "verify":
+            result = verify_dependency_closure(db)
+            logger.info(f"Task dependency closure: {result}")
+            sys.exit(0 if result["consistent"] else 1)
+        else:
+            sys.exit(f"Unknown command '{command}', expected 'rebuild' or 'verify'")
+    finally:
+        db.close()
\ No newline at end of file
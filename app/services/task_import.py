@@ -0,0 +1,166 @@
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from datetime import datetime
+import json
+import logging
+
+from pydantic import ValidationError
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import Task, Project, Branch
+from app.models.task import task_tags, task_dependencies
+from app.schemas import TaskCreate
+from app.services.task_graph import refresh_dependency_closure
+from app.services.task_relations import resolve_tags
+
+logger = logging.getLogger(__name__)
+
+
+async def ndjson_batches(
+    chunks: AsyncIterator[bytes],
+    batch_size: int = settings.TASK_IMPORT_BATCH_SIZE
+) -> AsyncIterator[List[Tuple[int, bytes]]]:
+    """Split a streamed body into batches of (line number, line), skipping blank lines.
+
+    Only the current batch and an incomplete trailing line are kept in memory.
+    """
+    batch: List[Tuple[int, bytes]] = []
+    buffer = b""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                batch.append((line_no, line))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if buffer.strip():
+        batch.append((line_no + 1, buffer))
+    if batch:
+        yield batch
+
+
+class TaskImportService:
+    """Writes batches of TaskCreate records with multi-row inserts.
+
+    Each batch is committed on its own, so a failed line or batch does not
+    undo the lines before it.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def import_batch(self, lines: List[Tuple[int, bytes]]) -> List[Dict[str, Any]]:
+        """Parse and insert one batch of NDJSON lines; returns a result per line, in order."""
+        results: Dict[int, Dict[str, Any]] = {}
+        records: List[Tuple[int, TaskCreate]] = []
+        for line_no, line in lines:
+            try:
+                records.append((line_no, TaskCreate(**json.loads(line))))
+            except (ValueError, TypeError, ValidationError) as e:
+                results[line_no] = {"line": line_no, "success": False, "error": f"Invalid record: {e}"}
+
+        try:
+            records = self._drop_invalid(records, results)
+            if records:
+                self._insert(records, results)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Task import batch starting at line {lines[0][0]} failed: {e}")
+            for line_no, _ in records:
+                results[line_no] = {"line": line_no, "success": False, "error": f"Batch failed: {e}"}
+        return [results[line_no] for line_no, _ in lines]
+
+    def _drop_invalid(
+        self,
+        records: List[Tuple[int, TaskCreate]],
+        results: Dict[int, Dict[str, Any]]
+    ) -> List[Tuple[int, TaskCreate]]:
+        """Report records whose project or branch is unknown, or whose youtrack_id is taken."""
+        project_ids = {task.project_id for _, task in records}
+        branch_ids = {task.branch_id for _, task in records if task.branch_id}
+        youtrack_ids = [task.youtrack_id for _, task in records if task.youtrack_id]
+
+        known_projects = set(self.db.execute(select(Project.id).where(Project.id.in_(project_ids))).scalars())
+        known_branches = set()
+        if branch_ids:
+            known_branches = set(self.db.execute(select(Branch.id).where(Branch.id.in_(branch_ids))).scalars())
+        taken = set()
+        if youtrack_ids:
+            taken = set(self.db.execute(select(Task.youtrack_id).where(Task.youtrack_id.in_(youtrack_ids))).scalars())
+
+        valid = []
+        for line_no, task in records:
+            if task.project_id not in known_projects:
+                error = "Project not found"
+            elif task.branch_id and task.branch_id not in known_branches:
+                error = "Branch not found"
+            elif task.youtrack_id and task.youtrack_id in taken:
+                error = f"Task with youtrack_id '{task.youtrack_id}' already exists"
+            else:
+                if task.youtrack_id:
+                    taken.add(task.youtrack_id)  # also rejects repeats later in the batch
+                valid.append((line_no, task))
+                continue
+            results[line_no] = {"line": line_no, "success": False, "error": error}
+        return valid
+
+    def _insert(self, records: List[Tuple[int, TaskCreate]], results: Dict[int, Dict[str, Any]]) -> None:
+        # Take the ids up front, so association rows need no RETURNING order guarantees
+        task_ids = list(self.db.execute(
+            select(func.nextval(func.pg_get_serial_sequence(Task.__tablename__, "id")))
+            .select_from(func.generate_series(1, len(records)))
+        ).scalars())
+        now = datetime.utcnow()
+        # Rows are passed as parameter sets, which SQLAlchemy sends as
+        # batched multi-row INSERTs without compiling a statement per batch
+        self.db.execute(insert(Task), [
+            {
+                **task.dict(exclude={"tags", "dependency_ids"}),
+                "id": task_id,
+                "version": 1,
+                "created_at": now,
+                "updated_at": now
+            }
+            for task_id, (_, task) in zip(task_ids, records)
+        ])
+
+        tag_ids = resolve_tags(self.db, {name for _, task in records for name in task.tags or []})
+        tag_rows = [
+            {"task_id": task_id, "tag_id": tag_ids[name]}
+            for task_id, (_, task) in zip(task_ids, records)
+            for name in set(task.tags or [])
+        ]
+        if tag_rows:
+            self.db.execute(insert(task_tags).on_conflict_do_nothing(), tag_rows)
+
+        # Dependencies may point at existing tasks or at tasks of this batch
+        dependency_ids = {dep_id for _, task in records for dep_id in task.dependency_ids or []}
+        found = set(task_ids) & dependency_ids
+        if dependency_ids - found:
+            found |= set(self.db.execute(select(Task.id).where(Task.id.in_(dependency_ids - found))).scalars())
+        dep_rows = [
+            {"task_id": task_id, "dependency_id": dep_id}
+            for task_id, (_, task) in zip(task_ids, records)
+            for dep_id in dict.fromkeys(task.dependency_ids or [])
+            if dep_id in found
+        ]
+        if dep_rows:
+            self.db.execute(insert(task_dependencies).on_conflict_do_nothing(), dep_rows)
+            refresh_dependency_closure(self.db, {row["task_id"] for row in dep_rows})
+
+        for task_id, (line_no, task) in zip(task_ids, records):
+            results[line_no] = {
+                "line": line_no,
+                "success": True,
+                "id": task_id,
+                "missing_dependency_ids": [
+                    dep_id for dep_id in dict.fromkeys(task.dependency_ids or []) if dep_id not in found
+                ]
+            }
\ No newline at end of file
@@ -0,0 +1,80 @@
+from typing import Dict, Iterable, List
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.models import Task
+from app.models.task import TaskStatus
+from app.schemas import TaskProblem
+from app.services.task_graph import dependency_closure, sets_with_closure_problems
+
+RELEASABLE_STATUSES = {TaskStatus.FOR_RELEASE.value, TaskStatus.IN_RELEASE.value}
+
+
+def _problem(task: Task, description: str) -> TaskProblem:
+    return TaskProblem(
+        id=task.id,
+        title=task.title,
+        status=task.status,
+        author=task.author,
+        developer=task.developer,
+        tags=[tag.name for tag in task.tags],
+        description=description
+    )
+
+
+def find_task_problems(db: Session, task_ids: Iterable[int]) -> Dict[int, List[TaskProblem]]:
+    """Release problems of each task in `task_ids` that exists, in one pass over their graphs.
+
+    The tasks, their dependencies and the dependencies' tags are loaded
+    eagerly. Releases are walked in detail only if the closure table shows
+    dependencies outside them or cycles, or if the table is not trusted yet.
+    """
+    tasks = db.query(Task).options(
+        selectinload(Task.dependencies).selectinload(Task.tags)
+    ).filter(Task.id.in_(set(task_ids))).all()
+    problems: Dict[int, List[TaskProblem]] = {task.id: [] for task in tasks}
+
+    release_tasks = [task for task in tasks if task.is_release_task]
+    members = {
+        task.id: {task.id} | {dep_task.id for dep_task in task.dependencies}
+        for task in release_tasks
+    }
+
+    # 1. Dependencies with an incorrect status
+    for task in release_tasks:
+        for dep_task in task.dependencies:
+            if dep_task.status not in RELEASABLE_STATUSES:
+                problems[task.id].append(_problem(
+                    dep_task,
+                    f"Task is in '{dep_task.status}' status, should be 'For Release' or 'In Release'"
+                ))
+
+    # 2. Dependencies of dependencies (at any depth) not included in the release, and cycles
+    closures = {
+        release_id: dependency_closure(db, members[release_id])
+        for release_id in sets_with_closure_problems(db, members)
+    }
+    related_ids = {
+        related_id
+        for closure in closures.values()
+        for related_id in list(closure.missing) + [task_id for cycle in closure.cycles for task_id in cycle]
+    }
+    related = {}
+    if related_ids:
+        related = {
+            related_task.id: related_task
+            for related_task in db.query(Task).options(selectinload(Task.tags)).filter(Task.id.in_(related_ids))
+        }
+
+    for release_id, closure in closures.items():
+        for dep_id, path in closure.missing.items():
+            chain = " → ".join(f"#{task_id}" for task_id in path.chain)
+            problems[release_id].append(_problem(
+                related[dep_id],
+                f"Dependency of task #{path.chain[-2]} is not included in the release ({chain})"
+            ))
+        for cycle in closure.cycles:
+            chain = " → ".join(f"#{task_id}" for task_id in cycle)
+            problems[release_id].append(_problem(related[cycle[0]], f"Circular dependency: {chain}"))
+
+    return problems
\ No newline at end of file
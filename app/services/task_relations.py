@@ -0,0 +1,58 @@
+from typing import Dict, Iterable, List
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import Task, Tag
+from app.models.task import task_tags, task_dependencies
+
+
+def resolve_tags(db: Session, names: Iterable[str]) -> Dict[str, int]:
+    """Ids of the given tag names, creating the missing ones.
+
+    New tags come back from INSERT ... ON CONFLICT DO NOTHING RETURNING;
+    names that already existed are looked up with one IN query.
+    """
+    names = sorted(set(names))  # a stable order keeps concurrent inserts from deadlocking
+    if not names:
+        return {}
+    tag_ids = dict(db.execute(
+        insert(Tag).values([{"name": name} for name in names])
+        .on_conflict_do_nothing(index_elements=[Tag.name])
+        .returning(Tag.name, Tag.id)
+    ).all())
+    existing = [name for name in names if name not in tag_ids]
+    if existing:
+        tag_ids.update(db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(existing))).all())
+    return tag_ids
+
+
+def set_task_tags(db: Session, task_id: int, names: Iterable[str], replace: bool = True) -> None:
+    """Give a task exactly these tags; `replace=False` skips clearing the old ones (new tasks)."""
+    tag_ids = resolve_tags(db, names)
+    if replace:
+        db.execute(delete(task_tags).where(task_tags.c.task_id == task_id))
+    if tag_ids:
+        db.execute(insert(task_tags).values([
+            {"task_id": task_id, "tag_id": tag_id} for tag_id in tag_ids.values()
+        ]).on_conflict_do_nothing())
+
+
+def set_task_dependencies(db: Session, task_id: int, dependency_ids: Iterable[int], replace: bool = True) -> List[int]:
+    """Give a task exactly these dependencies and return the ids that do not exist.
+
+    The caller refreshes the dependency closure.
+    """
+    dependency_ids = list(dict.fromkeys(dependency_ids))
+    found = set()
+    if dependency_ids:
+        found = set(db.execute(select(Task.id).where(Task.id.in_(dependency_ids))).scalars())
+    if replace:
+        db.execute(delete(task_dependencies).where(task_dependencies.c.task_id == task_id))
+    if found:
+        db.execute(insert(task_dependencies).values([
+            {"task_id": task_id, "dependency_id": dependency_id}
+            for dependency_id in dependency_ids if dependency_id in found
+        ]).on_conflict_do_nothing())
+    return [dependency_id for dependency_id in dependency_ids if dependency_id not in found]
\ No newline at end of file
@@ -0,0 +1,301 @@
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
+import logging
+import queue
+import threading
+import time
+
+from sqlalchemy import update, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database.session import SessionLocal
+from app.models import Project, Commit, MergeRequest
+from app.models.merge_request import MergeRequestStatus
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EVENTS = {"push", "merge_request", "pipeline"}
+
+MR_STATES = {
+    "opened": MergeRequestStatus.OPEN,
+    "reopened": MergeRequestStatus.OPEN,
+    "locked": MergeRequestStatus.OPEN,
+    "merged": MergeRequestStatus.MERGED,
+    "closed": MergeRequestStatus.CLOSED,
+}
+
+
+def parse_gitlab_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Convert a GitLab ISO timestamp to naive UTC, as stored by the models."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _commit_rows(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    ref = payload.get("ref") or ""
+    branch_name = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref or None
+    rows = []
+    for commit in payload.get("commits") or []:
+        if not isinstance(commit["id"], str) or not commit["id"]:
+            raise ValueError(f"invalid commit id {commit['id']!r}")
+        rows.append({
+            "hash": commit["id"],
+            "message": commit.get("message"),
+            "author": (commit.get("author") or {}).get("name"),
+            "branch_name": branch_name,
+            "committed_at": parse_gitlab_timestamp(commit.get("timestamp")),
+        })
+    return rows
+
+
+def _merge_request_row(payload: Dict[str, Any], project_id: Optional[int]) -> Dict[str, Any]:
+    attrs = payload["object_attributes"]
+    if not isinstance(attrs["iid"], int):
+        raise ValueError(f"invalid merge request iid {attrs['iid']!r}")
+    status = MR_STATES.get(attrs.get("state"), MergeRequestStatus.OPEN)
+    merge_status = attrs.get("merge_status")
+    if status == MergeRequestStatus.OPEN and merge_status == "cannot_be_merged":
+        status = MergeRequestStatus.CONFLICT
+    assignees = payload.get("assignees") or []
+    return {
+        "project_id": project_id,
+        "iid": attrs["iid"],
+        "title": attrs.get("title") or "",
+        "description": attrs.get("description"),
+        "source_branch": attrs.get("source_branch") or "",
+        "target_branch": attrs.get("target_branch") or "",
+        "status": status,
+        "can_be_merged": merge_status == "can_be_merged",
+        "assigned_to": assignees[0].get("username") if assignees else None,
+    }
+
+
+def _pipeline_update(payload: Dict[str, Any]) -> Dict[str, Any]:
+    attrs = payload.get("object_attributes") or {}
+    merge_request_iid = payload["merge_request"]["iid"] if payload.get("merge_request") else None
+    return {"ref": attrs.get("ref"), "status": attrs.get("status"), "merge_request_iid": merge_request_iid}
+
+
+def _parse_event(kind: str, payload: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+    """The GitLab project id of an event and the rows it writes.
+
+    Raises AttributeError, KeyError, TypeError or ValueError for a malformed payload.
+    """
+    if kind == "push":
+        return None, _commit_rows(payload)
+    gitlab_id = (payload.get("project") or {}).get("id")
+    gitlab_id = str(gitlab_id) if gitlab_id is not None else None
+    if kind == "merge_request":
+        return gitlab_id, _merge_request_row(payload, None)
+    return gitlab_id, _pipeline_update(payload)
+
+
+def ingest_events(db: Session, events: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, int]:
+    """Write a batch of GitLab webhook events with one upsert per table.
+
+    Commits are keyed on hash and merge requests on (project, iid); when a
+    batch holds several events for the same row the latest one wins.
+    Malformed events are logged and counted as invalid; the rest are written.
+    """
+    parsed: List[Tuple[str, Optional[str], Any]] = []
+    invalid = 0
+    for kind, payload in events:
+        try:
+            parsed.append((kind, *_parse_event(kind, payload)))
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            invalid += 1
+            logger.warning(f"Skipping malformed GitLab {kind} event: {e!r}")
+
+    gitlab_ids = {gitlab_id for _, gitlab_id, _ in parsed if gitlab_id is not None}
+    projects = {}
+    if gitlab_ids:
+        projects = dict(
+            db.query(Project.gitlab_project_id, Project.id)
+            .filter(Project.gitlab_project_id.in_(gitlab_ids))
+            .all()
+        )
+
+    now = datetime.utcnow()
+    commits: Dict[str, Dict[str, Any]] = {}
+    merge_requests: Dict[Tuple[int, int], Dict[str, Any]] = {}
+    pipelines: List[Tuple[int, Dict[str, Any]]] = []
+    skipped = 0
+
+    for kind, gitlab_id, data in parsed:
+        if kind == "push":
+            for row in data:
+                commits[row["hash"]] = {**row, "created_at": now}
+            continue
+
+        project_id = projects.get(gitlab_id)
+        if project_id is None:
+            skipped += 1
+            continue
+        if kind == "merge_request":
+            merge_requests[(project_id, data["iid"])] = {
+                **data, "project_id": project_id, "created_at": now, "updated_at": now
+            }
+        elif kind == "pipeline":
+            pipelines.append((project_id, data))
+
+    if commits:
+        stmt = insert(Commit).values(list(commits.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Commit.hash],
+            set_={
+                "message": stmt.excluded.message,
+                "author": stmt.excluded.author,
+                "committed_at": stmt.excluded.committed_at,
+                # keep the branch a commit was first seen on
+                "branch_name": func.coalesce(Commit.branch_name, stmt.excluded.branch_name),
+            }
+        )
+        db.execute(stmt)
+
+    if merge_requests:
+        stmt = insert(MergeRequest).values(list(merge_requests.values()))
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_merge_requests_project_iid",
+            set_={
+                "title": stmt.excluded.title,
+                "description": stmt.excluded.description,
+                "source_branch": stmt.excluded.source_branch,
+                "target_branch": stmt.excluded.target_branch,
+                "status": stmt.excluded.status,
+                "can_be_merged": stmt.excluded.can_be_merged,
+                "assigned_to": stmt.excluded.assigned_to,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        db.execute(stmt)
+
+    for project_id, pipeline in pipelines:
+        query = update(MergeRequest).where(MergeRequest.project_id == project_id)
+        if pipeline["merge_request_iid"] is not None:
+            query = query.where(MergeRequest.iid == pipeline["merge_request_iid"])
+        else:
+            query = query.where(
+                MergeRequest.source_branch == pipeline["ref"],
+                MergeRequest.status.in_([MergeRequestStatus.OPEN, MergeRequestStatus.CONFLICT])
+            )
+        db.execute(query.values(pipeline_status=pipeline["status"], updated_at=now))
+
+    db.commit()
+    return {
+        "commits": len(commits),
+        "merge_requests": len(merge_requests),
+        "pipelines": len(pipelines),
+        "skipped": skipped,
+        "invalid": invalid,
+    }
+
+
+class WebhookIngestionQueue:
+    """Bounded in-process queue drained by a background thread in batches."""
+
+    def __init__(
+        self,
+        maxsize: int = settings.WEBHOOK_QUEUE_SIZE,
+        batch_size: int = settings.WEBHOOK_BATCH_SIZE,
+        flush_interval: float = settings.WEBHOOK_FLUSH_INTERVAL
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {"accepted": 0, "rejected": 0, "ingested": 0, "invalid": 0, "failed": 0, "batches": 0}
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="webhook-ingestion", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush pending events and stop the worker."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> bool:
+        """Queue an event; returns False when the queue is full."""
+        try:
+            self._queue.put_nowait((kind, payload))
+        except queue.Full:
+            self._count("rejected", 1)
+            return False
+        self._count("accepted", 1)
+        return True
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+
+    def _write(self, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+        db = SessionLocal()
+        try:
+            result = ingest_events(db, batch)
+            self._record(len(batch), result)
+            logger.info(f"Ingested {len(batch)} GitLab events: {result}")
+            return
+        except Exception as e:
+            db.rollback()
+            error = e
+        finally:
+            db.close()
+
+        if len(batch) == 1:
+            self._count("failed", 1)
+            logger.error(f"Failed to ingest a GitLab {batch[0][0]} event: {error}")
+            return
+        # Write the events one by one, so only the ones that break the batch are lost
+        logger.warning(f"Failed to ingest {len(batch)} GitLab events, retrying one by one: {error}")
+        for event in batch:
+            self._write([event])
+
+    def _record(self, events: int, result: Dict[str, int]) -> None:
+        with self._lock:
+            self._stats["ingested"] += events - result["invalid"]
+            self._stats["invalid"] += result["invalid"]
+            self._stats["batches"] += 1
+
+    def _count(self, name: str, delta: int) -> None:
+        with self._lock:
+            self._stats[name] += delta
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "queued": self._queue.qsize()}
+
+
+ingestion_queue = WebhookIngestionQueue()
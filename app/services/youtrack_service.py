@@ -1,6 +1,8 @@
-from typing import List, Optional, Dict, Any
-import requests
+from typing import List, Optional, Dict, Any, Iterator
 from app.core.config import settings
+from app.services.http_client import get_http_client, get_async_http_client, gather_bounded
+from app.services.http_cache import get_response_cache, cache_key
+from app.services.singleflight import flights, async_flights
 
 class YouTrackService:
     def __init__(self):
@@ -11,15 +13,42 @@ class YouTrackService:
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
+        self.client = get_http_client()
+        self.cache = get_response_cache()
 
-    def get_issue(self, issue_id: str) -> Dict[str, Any]:
-        """Get issue details from YouTrack"""
-        response = requests.get(
-            f"{self.base_url}/api/issues/{issue_id}",
-            headers=self.headers
+    def _send(self, method: str, path: str, headers: Optional[Dict[str, str]] = None, **kwargs):
+        """Send a request to the YouTrack API over the shared connection pool"""
+        response = self.client.request(
+            method,
+            f"{self.base_url}/api{path}",
+            headers={**self.headers, **(headers or {})},
+            **kwargs
         )
         response.raise_for_status()
-        return response.json()
+        return response
+
+    def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request to the YouTrack API and return the decoded body"""
+        return self._send(method, path, **kwargs).json()
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None, cached: bool = False) -> Any:
+        """GET a resource, sharing one upstream call between identical concurrent requests"""
+        key = cache_key(f"{self.base_url}/api{path}", params)
+        return flights.do(key, lambda: self._fetch(key, path, params, cached))
+
+    def _fetch(self, key: str, path: str, params: Optional[Dict[str, Any]], cached: bool) -> Any:
+        """GET a resource, optionally through the conditional response cache"""
+        if not cached or self.cache is None:
+            return self._request("GET", path, params=params)
+        entry = self.cache.fetch(
+            key,
+            lambda conditional_headers: self._send("GET", path, headers=conditional_headers, params=params)
+        )
+        return entry.body
+
+    def get_issue(self, issue_id: str) -> Dict[str, Any]:
+        """Get issue details from YouTrack"""
+        return self._get(f"/issues/{issue_id}", cached=True)
 
     def create_issue(
         self,
@@ -35,62 +64,66 @@ class YouTrackService:
             "description": description,
             **fields
         }
-        response = requests.post(
-            f"{self.base_url}/api/issues",
-            headers=self.headers,
+        return self._request(
+            "POST",
+            "/issues",
             json=data
         )
-        response.raise_for_status()
-        return response.json()
 
     def update_issue(self, issue_id: str, **fields) -> Dict[str, Any]:
         """Update an existing issue"""
-        response = requests.post(
-            f"{self.base_url}/api/issues/{issue_id}",
-            headers=self.headers,
+        return self._request(
+            "POST",
+            f"/issues/{issue_id}",
             json=fields
         )
-        response.raise_for_status()
-        return response.json()
 
     def get_issues(
         self,
         project_id: str,
         query: Optional[str] = None,
-        fields: Optional[List[str]] = None
+        fields: Optional[List[str]] = None,
+        skip: Optional[int] = None,
+        top: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Get issues for a project with optional filtering"""
         params = {
             "query": f"project: {project_id} {query or ''}",
-            "fields": ",".join(fields) if fields else None
+            "fields": ",".join(fields) if fields else None,
+            "$skip": skip,
+            "$top": top
         }
-        response = requests.get(
-            f"{self.base_url}/api/issues",
-            headers=self.headers,
-            params=params
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get("/issues", params=params)
+
+    def iter_issues(
+        self,
+        project_id: str,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 500
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of issues until YouTrack returns a short page"""
+        skip = 0
+        while True:
+            page = self.get_issues(project_id, query=query, fields=fields, skip=skip, top=page_size)
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            skip += len(page)
 
     def add_comment(self, issue_id: str, text: str) -> Dict[str, Any]:
         """Add a comment to an issue"""
         data = {"text": text}
-        response = requests.post(
-            f"{self.base_url}/api/issues/{issue_id}/comments",
-            headers=self.headers,
+        return self._request(
+            "POST",
+            f"/issues/{issue_id}/comments",
             json=data
         )
-        response.raise_for_status()
-        return response.json()
 
     def get_issue_links(self, issue_id: str) -> List[Dict[str, Any]]:
         """Get all links for an issue"""
-        response = requests.get(
-            f"{self.base_url}/api/issues/{issue_id}/links",
-            headers=self.headers
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get(f"/issues/{issue_id}/links", cached=True)
 
     def create_issue_link(
         self,
@@ -103,10 +136,110 @@ class YouTrackService:
             "issueId": linked_issue_id,
             "type": link_type
         }
-        response = requests.post(
-            f"{self.base_url}/api/issues/{issue_id}/links",
-            headers=self.headers,
+        return self._request(
+            "POST",
+            f"/issues/{issue_id}/links",
             json=data
+        ) 
+
+
+class AsyncYouTrackService:
+    """Asyncio version of YouTrackService for concurrent fan-out."""
+
+    def __init__(self, concurrency: int = settings.HTTP_MAX_CONCURRENCY):
+        self.base_url = settings.YOUTRACK_URL
+        self.token = settings.YOUTRACK_TOKEN
+        self.headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        self.concurrency = concurrency
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request to the YouTrack API; identical concurrent GETs share one call"""
+        url = f"{self.base_url}/api{path}"
+        if method == "GET":
+            return await async_flights.do(
+                cache_key(url, kwargs.get("params")),
+                lambda: self._send(method, url, **kwargs)
+            )
+        return await self._send(method, url, **kwargs)
+
+    async def _send(self, method: str, url: str, **kwargs) -> Any:
+        """Send a request over the shared async connection pool"""
+        response = await get_async_http_client().request(
+            method,
+            url,
+            headers=self.headers,
+            **kwargs
         )
         response.raise_for_status()
-        return response.json() 
\ No newline at end of file
+        return response.json()
+
+    async def get_issue(self, issue_id: str) -> Dict[str, Any]:
+        """Get issue details from YouTrack"""
+        return await self._request("GET", f"/issues/{issue_id}")
+
+    async def create_issue(
+        self,
+        project_id: str,
+        summary: str,
+        description: Optional[str] = None,
+        **fields
+    ) -> Dict[str, Any]:
+        """Create a new issue in YouTrack"""
+        data = {
+            "project": {"id": project_id},
+            "summary": summary,
+            "description": description,
+            **fields
+        }
+        return await self._request("POST", "/issues", json=data)
+
+    async def update_issue(self, issue_id: str, **fields) -> Dict[str, Any]:
+        """Update an existing issue"""
+        return await self._request("POST", f"/issues/{issue_id}", json=fields)
+
+    async def get_issues(
+        self,
+        project_id: str,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get issues for a project with optional filtering"""
+        params = {
+            "query": f"project: {project_id} {query or ''}",
+        }
+        if fields:
+            params["fields"] = ",".join(fields)
+        return await self._request("GET", "/issues", params=params)
+
+    async def add_comment(self, issue_id: str, text: str) -> Dict[str, Any]:
+        """Add a comment to an issue"""
+        data = {"text": text}
+        return await self._request("POST", f"/issues/{issue_id}/comments", json=data)
+
+    async def get_issue_links(self, issue_id: str) -> List[Dict[str, Any]]:
+        """Get all links for an issue"""
+        return await self._request("GET", f"/issues/{issue_id}/links")
+
+    async def create_issue_link(
+        self,
+        issue_id: str,
+        linked_issue_id: str,
+        link_type: str
+    ) -> Dict[str, Any]:
+        """Create a link between two issues"""
+        data = {
+            "issueId": linked_issue_id,
+            "type": link_type
+        }
+        return await self._request("POST", f"/issues/{issue_id}/links", json=data)
+
+    async def get_issues_by_ids(self, issue_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get many issues concurrently, at most `concurrency` requests at a time"""
+        return await gather_bounded(
+            (self.get_issue(issue_id) for issue_id in issue_ids),
+            limit=self.concurrency
+        )
\ No newline at end of file
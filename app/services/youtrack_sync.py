@@ -0,0 +1,242 @@
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timedelta
+import logging
+
+from sqlalchemy import delete, select, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.database.session import SessionLocal
+from app.models import Project, Task, SyncCursor
+from app.models.task import TaskStatus, task_tags, task_dependencies
+from app.services.youtrack_service import YouTrackService
+from app.services.task_graph import refresh_dependency_closure
+from app.services.task_relations import resolve_tags
+
+logger = logging.getLogger(__name__)
+
+SYNC_SOURCE = "youtrack"
+
+ISSUE_FIELDS = [
+    "idReadable",
+    "summary",
+    "description",
+    "updated",
+    "reporter(login,fullName)",
+    "tags(name)",
+    "customFields(name,value(name,login,fullName))",
+    # Same shape as GET /issues/{id}/links, so links are read in the same request
+    "links(direction,linkType(name),issues(idReadable))",
+]
+
+
+def _custom_field(issue: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+    for field in issue.get("customFields") or []:
+        if field.get("name") == name:
+            value = field.get("value")
+            return value if isinstance(value, dict) else None
+    return None
+
+
+def _person(value: Optional[Dict[str, Any]]) -> Optional[str]:
+    if not value:
+        return None
+    return value.get("fullName") or value.get("login") or value.get("name")
+
+
+def _linked_keys(links: List[Dict[str, Any]], direction: str) -> List[str]:
+    keys = []
+    for link in links or []:
+        link_type = (link.get("linkType") or {}).get("name")
+        if link_type not in settings.YOUTRACK_DEPENDENCY_LINK_TYPES or link.get("direction") != direction:
+            continue
+        keys.extend(issue["idReadable"] for issue in link.get("issues") or [] if issue.get("idReadable"))
+    return keys
+
+
+def dependency_keys(links: List[Dict[str, Any]]) -> List[str]:
+    """Readable ids the issue depends on, from a links payload (GET /issues/{id}/links).
+
+    This is the inward side of dependency link types ("depends on").
+    """
+    return _linked_keys(links, "INWARD")
+
+
+def dependent_keys(links: List[Dict[str, Any]]) -> List[str]:
+    """Readable ids of the issues that depend on the issue: the outward side ("is required for")."""
+    return _linked_keys(links, "OUTWARD")
+
+
+class YouTrackSyncService:
+    def __init__(self, db: Session, youtrack: Optional[YouTrackService] = None):
+        self.db = db
+        self.youtrack = youtrack or YouTrackService()
+
+    def get_cursor(self, project_id: int) -> Optional[int]:
+        return self.db.query(SyncCursor.cursor).filter(
+            SyncCursor.source == SYNC_SOURCE,
+            SyncCursor.project_id == project_id
+        ).scalar()
+
+    def _save_cursor(self, project_id: int, cursor: int) -> None:
+        stmt = insert(SyncCursor).values(
+            source=SYNC_SOURCE, project_id=project_id, cursor=cursor, updated_at=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_sync_cursors_source_project",
+            set_={"cursor": stmt.excluded.cursor, "updated_at": stmt.excluded.updated_at}
+        )
+        self.db.execute(stmt)
+
+    def _updated_since_query(self, cursor: Optional[int]) -> Optional[str]:
+        if cursor is None:
+            return None
+        since = datetime.utcfromtimestamp(cursor / 1000) - timedelta(minutes=settings.YOUTRACK_SYNC_OVERLAP_MINUTES)
+        return f"updated: {since.strftime('%Y-%m-%dT%H:%M')} .. * sort by: updated asc"
+
+    def sync_project(self, project_id: int, full: bool = False) -> Dict[str, Any]:
+        """Mirror issues changed since the stored cursor into tasks, tags and dependencies.
+
+        Each page is written with set-based upserts and committed together with
+        the advanced cursor, so an interrupted run resumes where it stopped.
+        """
+        project = self.db.query(Project).filter(Project.id == project_id).first()
+        if not project:
+            return {"success": False, "message": "Project not found"}
+        if not project.youtrack_project_id:
+            return {"success": False, "message": "Project has no YouTrack project configured"}
+
+        cursor = None if full else self.get_cursor(project_id)
+        query = self._updated_since_query(cursor) or "sort by: updated asc"
+        result = {"success": True, "issues": 0, "dependencies": 0, "missing_dependencies": 0}
+
+        for page in self.youtrack.iter_issues(
+            project.youtrack_project_id,
+            query=query,
+            fields=ISSUE_FIELDS,
+            page_size=settings.YOUTRACK_SYNC_PAGE_SIZE
+        ):
+            written, missing = self._write_page(project_id, page)
+            page_cursor = max((issue.get("updated") or 0) for issue in page)
+            cursor = max(cursor or 0, page_cursor)
+            self._save_cursor(project_id, cursor)
+            self.db.commit()
+            result["issues"] += len(page)
+            result["dependencies"] += written
+            result["missing_dependencies"] += missing
+
+        result["cursor"] = cursor
+        logger.info(f"YouTrack sync of project {project_id}: {result}")
+        return result
+
+    def _write_page(self, project_id: int, issues: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Upsert one page of issues; returns (dependency rows written, dependencies not found)."""
+        now = datetime.utcnow()
+        rows = {}
+        for issue in issues:
+            state = _custom_field(issue, "State")
+            rows[issue["idReadable"]] = {
+                "youtrack_id": issue["idReadable"],
+                "title": issue.get("summary") or issue["idReadable"],
+                "description": issue.get("description"),
+                "status": (state or {}).get("name") or TaskStatus.TO_DO.value,
+                "author": _person(issue.get("reporter")),
+                "developer": _person(_custom_field(issue, "Assignee")),
+                "is_release_task": False,
+                "project_id": project_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+
+        stmt = insert(Task).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Task.youtrack_id],
+            set_={
+                "title": stmt.excluded.title,
+                "description": stmt.excluded.description,
+                "status": stmt.excluded.status,
+                "author": stmt.excluded.author,
+                "developer": stmt.excluded.developer,
+                "updated_at": stmt.excluded.updated_at,
+                "version": Task.version + 1,
+            }
+        ).returning(Task.id, Task.youtrack_id)
+        task_ids = {youtrack_id: task_id for task_id, youtrack_id in self.db.execute(stmt)}
+        synced_ids = list(task_ids.values())
+
+        # Tags: create missing names, then resolve all ids with one lookup
+        issue_tags = {
+            issue["idReadable"]: {tag["name"] for tag in issue.get("tags") or [] if tag.get("name")}
+            for issue in issues
+        }
+        tag_names = set().union(*issue_tags.values())
+        self.db.execute(delete(task_tags).where(task_tags.c.task_id.in_(synced_ids)))
+        if tag_names:
+            tag_ids = resolve_tags(self.db, tag_names)
+            tag_rows = [
+                {"task_id": task_ids[key], "tag_id": tag_ids[name]}
+                for key, names in issue_tags.items()
+                for name in names
+            ]
+            if tag_rows:
+                self.db.execute(insert(task_tags).values(tag_rows).on_conflict_do_nothing())
+
+        # Dependencies: a synced issue lists its links in both directions, so
+        # an edge to an issue that was not synced yet is recovered from the
+        # other side when that issue is synced. The sync owns the edges
+        # between YouTrack tasks and replaces those touching the synced
+        # tasks; dependencies on tasks created by hand are kept
+        edges = set()
+        for issue in issues:
+            key = issue["idReadable"]
+            edges.update((key, dep_key) for dep_key in dependency_keys(issue.get("links")) if dep_key != key)
+            edges.update((dependent_key, key) for dependent_key in dependent_keys(issue.get("links")) if dependent_key != key)
+        linked_ids = dict(task_ids)
+        unknown = {key for edge in edges for key in edge} - linked_ids.keys()
+        if unknown:
+            linked_ids.update(
+                self.db.execute(select(Task.youtrack_id, Task.id).where(Task.youtrack_id.in_(unknown))).all()
+            )
+
+        td = task_dependencies
+        dependent = aliased(Task)
+        dependency = aliased(Task)
+        changed_ids = set(synced_ids) | set(self.db.execute(
+            delete(td).where(
+                or_(td.c.task_id.in_(synced_ids), td.c.dependency_id.in_(synced_ids)),
+                select(dependent.id).where(dependent.id == td.c.task_id, dependent.youtrack_id.is_not(None)).exists(),
+                select(dependency.id).where(dependency.id == td.c.dependency_id, dependency.youtrack_id.is_not(None)).exists()
+            ).returning(td.c.task_id)
+        ).scalars())
+        dep_rows = [
+            {"task_id": linked_ids[key], "dependency_id": linked_ids[dep_key]}
+            for key, dep_key in edges
+            if key in linked_ids and dep_key in linked_ids
+        ]
+        if dep_rows:
+            self.db.execute(insert(td).values(dep_rows).on_conflict_do_nothing())
+            changed_ids.update(row["task_id"] for row in dep_rows)
+        refresh_dependency_closure(self.db, changed_ids)
+        return len(dep_rows), len(edges) - len(dep_rows)
+
+
+def sync_project_in_background(project_id: int, full: bool = False) -> None:
+    """Run a sync with its own session (used from BackgroundTasks and the CLI)."""
+    db = SessionLocal()
+    try:
+        YouTrackSyncService(db).sync_project(project_id, full=full)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"YouTrack sync of project {project_id} failed: {e}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    args = [arg for arg in sys.argv[1:] if arg != "--full"]
+    for arg in args:
+        sync_project_in_background(int(arg), full="--full" in sys.argv)
@@ -0,0 +1,196 @@
+"""Throughput and latency benchmark for the GitLab/YouTrack service clients.
+
+Starts the fake upstreams from benchmarks.fake_upstreams in-process, points
+the settings at them and drives the service clients from a thread pool (or
+an event loop for the async scenarios). Example:
+
+    python -m benchmarks.bench_clients --threads 16 --requests 2000 --latency-ms 20 --throttle-rate 0.01
+
+Prints one line per scenario with throughput and p50/p95/p99 latency;
+--json writes the same numbers to a file.
+"""
+from typing import Any, Callable, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from benchmarks.fake_upstreams import (
+    FakeData,
+    FakeGitLabHandler,
+    FakeYouTrackHandler,
+    add_config_arguments,
+    config_from_args,
+    server_url,
+    start_fake_server,
+)
+
+PROJECT_ID = "42"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(name: str, latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    calls = len(latencies) + errors
+    return {
+        "scenario": name,
+        "calls": calls,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(calls / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 2),
+    }
+
+
+def run_threaded(name: str, call: Callable[[int], Any], requests: int, threads: int) -> Dict[str, Any]:
+    """Run `call(i)` for i in range(requests) on a thread pool, timing each call."""
+    def timed(i: int):
+        start = time.perf_counter()
+        try:
+            call(i)
+        except Exception:
+            return None
+        return time.perf_counter() - start
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(timed, range(requests)))
+    elapsed = time.perf_counter() - started
+    latencies = [result for result in results if result is not None]
+    return summarize(name, latencies, len(results) - len(latencies), elapsed)
+
+
+def run_async(name: str, call: Callable[[int], Any], requests: int) -> Dict[str, Any]:
+    """Run `await call(i)` for i in range(requests) concurrently on one event loop."""
+    async def timed(i: int):
+        start = time.perf_counter()
+        try:
+            await call(i)
+        except Exception:
+            return None
+        return time.perf_counter() - start
+
+    async def main():
+        from app.services.http_client import close_async_http_client
+
+        try:
+            return await asyncio.gather(*(timed(i) for i in range(requests)))
+        finally:
+            await close_async_http_client()
+
+    started = time.perf_counter()
+    results = asyncio.run(main())
+    elapsed = time.perf_counter() - started
+    latencies = [result for result in results if result is not None]
+    return summarize(name, latencies, len(results) - len(latencies), elapsed)
+
+
+def scenarios(args: argparse.Namespace) -> Dict[str, Callable[[], Dict[str, Any]]]:
+    # Imported after the settings environment is prepared in main()
+    from app.services.gitlab_service import GitLabService, AsyncGitLabService
+    from app.services.youtrack_service import YouTrackService, AsyncYouTrackService
+
+    gitlab = GitLabService()
+    youtrack = YouTrackService()
+    issue_count = args.issues
+    pages = max(1, args.requests // 20)
+
+    return {
+        "gitlab.get_project": lambda: run_threaded(
+            "gitlab.get_project", lambda i: gitlab.get_project(str(i % 50)), args.requests, args.threads
+        ),
+        "gitlab.get_branches": lambda: run_threaded(
+            "gitlab.get_branches", lambda i: gitlab.get_branches(PROJECT_ID), pages, args.threads
+        ),
+        "gitlab.iter_branches[prefetch]": lambda: run_threaded(
+            "gitlab.iter_branches[prefetch]",
+            lambda i: list(gitlab.iter_branches(PROJECT_ID, per_page=20, prefetch=4)),
+            pages,
+            args.threads
+        ),
+        "youtrack.get_issue": lambda: run_threaded(
+            "youtrack.get_issue", lambda i: youtrack.get_issue(f"EXP-{i % issue_count + 1}"), args.requests, args.threads
+        ),
+        "youtrack.iter_issues": lambda: run_threaded(
+            "youtrack.iter_issues", lambda i: list(youtrack.iter_issues(PROJECT_ID, page_size=100)), pages, args.threads
+        ),
+        "async.gitlab.get_project": lambda: run_async(
+            "async.gitlab.get_project", lambda i: AsyncGitLabService().get_project(str(i % 50)), args.requests
+        ),
+        "async.youtrack.get_issue": lambda: run_async(
+            "async.youtrack.get_issue",
+            lambda i: AsyncYouTrackService().get_issue(f"EXP-{i % issue_count + 1}"),
+            args.requests
+        ),
+    }
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    columns = ["scenario", "calls", "errors", "throughput_rps", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+    widths = {column: max(len(column), *(len(str(result[column])) for result in results)) for column in columns}
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    for result in results:
+        print("  ".join(str(result[column]).ljust(widths[column]) for column in columns))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the GitLab/YouTrack clients against fake upstreams")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--scenario", action="append", help="run only these scenarios (repeatable)")
+    parser.add_argument("--cache", action="store_true", help="keep the response cache enabled")
+    parser.add_argument("--json", help="write results to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    config = config_from_args(args)
+    data = FakeData(config)
+    gitlab_server = start_fake_server(FakeGitLabHandler, config, data)
+    youtrack_server = start_fake_server(FakeYouTrackHandler, config, data)
+
+    os.environ["GITLAB_URL"] = server_url(gitlab_server)
+    os.environ["YOUTRACK_URL"] = server_url(youtrack_server)
+    os.environ.setdefault("GITLAB_TOKEN", "benchmark")
+    os.environ.setdefault("YOUTRACK_TOKEN", "benchmark")
+    os.environ["HTTP_CACHE_ENABLED"] = "true" if args.cache else "false"
+    # The clients never touch the database, but Settings requires these
+    for name in ("POSTGRES_SERVER", "POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_PORT"):
+        os.environ.setdefault(name, "benchmark")
+
+    available = scenarios(args)
+    selected = args.scenario or list(available)
+    unknown = set(selected) - available.keys()
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}; choose from {', '.join(available)}")
+
+    results = [available[name]() for name in selected]
+    print_table(results)
+    upstream = {
+        "gitlab": dict(gitlab_server.RequestHandlerClass.stats),
+        "youtrack": dict(youtrack_server.RequestHandlerClass.stats),
+    }
+    print(f"upstream: {upstream}")
+
+    if args.json:
+        from app.services.rate_limit import scheduler_stats
+
+        with open(args.json, "w") as f:
+            json.dump({"results": results, "upstream": upstream, "hosts": scheduler_stats()}, f, indent=2)
+
+    gitlab_server.shutdown()
+    youtrack_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
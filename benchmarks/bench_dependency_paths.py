@@ -0,0 +1,112 @@
+"""Check that dependency walks stay bounded on graphs with many diamonds.
+
+Builds a layered graph in the configured database: the root depends on
+every task of the first level, and each task depends on every task of the
+next level. With 20 levels of width 2 there are 2^20 distinct paths to the
+last level, while the walk should only touch the 40 tasks. Everything is
+written inside a transaction that is rolled back at the end. Example:
+
+    python -m benchmarks.bench_dependency_paths --levels 20 --width 2 --max-seconds 2
+
+Runs dependency_paths and dependency_closure, compares the chains with
+a breadth-first search done in Python, and adds a cycle back to the root
+to check it is reported. Exits with status 1 if a check fails or a walk
+takes longer than --max-seconds.
+"""
+from typing import Dict, List
+from collections import deque
+import argparse
+import sys
+import time
+
+from sqlalchemy import insert
+
+from app.database.session import SessionLocal
+from app.models import Project, Task
+from app.models.task import task_dependencies
+from app.services.task_graph import dependency_paths, dependency_closure, refresh_dependency_closure
+
+
+def shortest_depths(edges: Dict[int, List[int]], root_id: int) -> Dict[int, int]:
+    depths = {root_id: 0}
+    queue = deque([root_id])
+    while queue:
+        task_id = queue.popleft()
+        for dependency_id in edges.get(task_id, []):
+            if dependency_id not in depths:
+                depths[dependency_id] = depths[task_id] + 1
+                queue.append(dependency_id)
+    del depths[root_id]
+    return depths
+
+
+def timed(name: str, call, max_seconds: float):
+    start = time.perf_counter()
+    result = call()
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {elapsed * 1000:.1f} ms")
+    if elapsed > max_seconds:
+        sys.exit(f"{name} took {elapsed:.2f}s, more than {max_seconds}s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, default=20)
+    parser.add_argument("--width", type=int, default=2)
+    parser.add_argument("--max-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        project = Project(name="bench-dependency-paths")
+        db.add(project)
+        db.flush()
+        tasks = [Task(title=f"bench {i}", status="Open", project_id=project.id) for i in range(args.levels * args.width + 1)]
+        db.add_all(tasks)
+        db.flush()
+        root_id = tasks[0].id
+        levels = [[root_id]] + [
+            [task.id for task in tasks[1 + level * args.width:1 + (level + 1) * args.width]]
+            for level in range(args.levels)
+        ]
+        edges = {
+            task_id: list(next_level)
+            for level, next_level in zip(levels, levels[1:])
+            for task_id in level
+        }
+        db.execute(insert(task_dependencies), [
+            {"task_id": task_id, "dependency_id": dependency_id}
+            for task_id, dependency_ids in edges.items()
+            for dependency_id in dependency_ids
+        ])
+        timed("refresh_dependency_closure", lambda: refresh_dependency_closure(db, list(edges)), args.max_seconds)
+        print(f"{len(tasks)} tasks, {args.width ** args.levels} paths from the root to the last level")
+
+        paths = timed("dependency_paths", lambda: dependency_paths(db, [root_id]), args.max_seconds)
+        expected = shortest_depths(edges, root_id)
+        found = {path.dependency_id: path for path in paths if not path.is_cycle}
+        if {task_id: path.depth for task_id, path in found.items()} != expected:
+            sys.exit("dependency_paths returned wrong depths")
+        for path in found.values():
+            if path.chain[0] != root_id or len(path.chain) != path.depth + 1 or any(
+                dependency_id not in edges.get(task_id, []) for task_id, dependency_id in zip(path.chain, path.chain[1:])
+            ):
+                sys.exit(f"dependency_paths returned a broken chain: {path.chain}")
+
+        # Close the graph into a cycle and walk it as a release would
+        db.execute(insert(task_dependencies), [{"task_id": levels[-1][0], "dependency_id": root_id}])
+        refresh_dependency_closure(db, [levels[-1][0]])
+        closure = timed("dependency_closure", lambda: dependency_closure(db, [root_id]), args.max_seconds)
+        if len(closure.missing) != len(expected):
+            sys.exit("dependency_closure returned wrong missing dependencies")
+        if not any(cycle[0] == cycle[-1] and root_id in cycle for cycle in closure.cycles):
+            sys.exit("dependency_closure did not report the cycle through the root")
+        print("ok")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,378 @@
+"""Local stand-ins for the GitLab and YouTrack HTTP APIs.
+
+Implements the endpoints used by GitLabService and YouTrackService with
+in-memory data, configurable latency, pagination, 429 injection and error
+rates. Run both servers with:
+
+    python -m benchmarks.fake_upstreams --gitlab-port 8081 --youtrack-port 8082 --latency-ms 20
+
+then point GITLAB_URL / YOUTRACK_URL at them.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote, urlencode
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+
+
+@dataclass
+class FakeConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0  # share of requests answered with 503
+    throttle_rate: float = 0.0  # share of requests answered with 429
+    retry_after: int = 1
+    rate_limit: int = 600  # reported in RateLimit-Limit
+    default_per_page: int = 20
+    max_per_page: int = 100
+    branches: int = 250
+    merge_requests: int = 120
+    issues: int = 500
+    commits: int = 200
+
+
+class FakeData:
+    """In-memory GitLab/YouTrack state shared by both servers."""
+
+    def __init__(self, config: FakeConfig):
+        self.lock = threading.Lock()
+        self.branches: List[Dict[str, Any]] = [
+            {"name": f"feature/EXP-{i}", "commit": {"id": _sha(f"branch-{i}")}, "merged": False}
+            for i in range(1, config.branches + 1)
+        ]
+        self.branches.insert(0, {"name": "develop", "commit": {"id": _sha("develop")}, "merged": False})
+        self.merge_requests: List[Dict[str, Any]] = [
+            {
+                "iid": i,
+                "title": f"EXP-{i} change",
+                "state": "opened" if i % 3 else "merged",
+                "source_branch": f"feature/EXP-{i}",
+                "target_branch": "develop",
+                "merge_status": "can_be_merged",
+            }
+            for i in range(1, config.merge_requests + 1)
+        ]
+        self.commits: List[Dict[str, Any]] = [
+            {
+                "id": _sha(f"commit-{i}"),
+                "short_id": _sha(f"commit-{i}")[:8],
+                "title": f"EXP-{i % config.issues + 1} commit {i}",
+                "message": f"EXP-{i % config.issues + 1} commit {i}",
+                "author_name": "Developer",
+                "committed_date": "2024-01-01T12:00:00+00:00",
+            }
+            for i in range(1, config.commits + 1)
+        ]
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        for i in range(1, config.issues + 1):
+            key = f"EXP-{i}"
+            links = []
+            if i > 1:
+                links.append({"direction": "INWARD", "linkType": {"name": "Depend"}, "issues": [{"idReadable": f"EXP-{i - 1}"}]})
+            self.issues[key] = {
+                "id": f"2-{i}",
+                "idReadable": key,
+                "summary": f"Issue {i}",
+                "description": None,
+                "updated": 1700000000000 + i * 1000,
+                "reporter": {"login": "admin", "fullName": "Admin"},
+                "tags": [{"name": "важное"}] if i % 5 == 0 else [],
+                "customFields": [{"name": "State", "value": {"name": "For Release" if i % 4 else "In Progress"}}],
+                "links": links,
+                "comments": [],
+            }
+
+
+def _sha(seed: str) -> str:
+    return hashlib.sha1(seed.encode()).hexdigest()
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; otherwise delayed ACKs add ~40ms per response
+    wbufsize = -1
+    disable_nagle_algorithm = True
+    config: FakeConfig
+    data: FakeData
+    routes: List[Tuple[str, "re.Pattern", str]] = []
+    stats: Dict[str, int]
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"null") if length else None
+
+        with self.data.lock:
+            self.stats["requests"] += 1
+        delay = max(0.0, random.gauss(self.config.latency_ms, self.config.jitter_ms)) / 1000
+        if delay:
+            time.sleep(delay)
+
+        roll = random.random()
+        if roll < self.config.throttle_rate:
+            self.stats["throttled"] += 1
+            return self._reply(429, {"message": "Too Many Requests"}, {"Retry-After": str(self.config.retry_after)})
+        if roll < self.config.throttle_rate + self.config.error_rate:
+            self.stats["errors"] += 1
+            return self._reply(503, {"message": "Service Unavailable"})
+
+        for route_method, pattern, name in self.routes:
+            match = pattern.fullmatch(url.path)
+            if route_method == method and match:
+                status, payload, headers = getattr(self, name)(*map(unquote, match.groups()), query=query, body=body)
+                return self._reply(status, payload, headers)
+        self._reply(404, {"message": "404 Not Found"})
+
+    def _reply(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        raw = json.dumps(payload).encode()
+        etag = f'"{hashlib.md5(raw).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.stats["not_modified"] += 1
+            status, raw = 304, b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.send_header("RateLimit-Limit", str(self.config.rate_limit))
+        self.send_header("RateLimit-Remaining", str(self.config.rate_limit))
+        self.send_header("RateLimit-Reset", str(int(time.time()) + 60))
+        if status in (200, 304):
+            self.send_header("ETag", etag)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _page(self, items: List[Any], query: Dict[str, str]) -> Tuple[int, List[Any], Dict[str, str]]:
+        """Offset pagination with GitLab headers (X-Total-Pages, X-Next-Page, Link)."""
+        per_page = min(int(query.get("per_page", self.config.default_per_page)), self.config.max_per_page)
+        page = max(int(query.get("page", 1)), 1)
+        total_pages = max((len(items) + per_page - 1) // per_page, 1)
+        headers = {
+            "X-Page": str(page),
+            "X-Per-Page": str(per_page),
+            "X-Total": str(len(items)),
+            "X-Total-Pages": str(total_pages),
+            "X-Next-Page": str(page + 1) if page < total_pages else "",
+        }
+        if page < total_pages:
+            base = f"http://{self.headers.get('Host')}{urlsplit(self.path).path}"
+            headers["Link"] = f'<{base}?{urlencode({**query, "page": page + 1})}>; rel="next"'
+        return 200, items[(page - 1) * per_page:page * per_page], headers
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+
+class FakeGitLabHandler(FakeHandler):
+    routes = [
+        ("GET", re.compile(r"/api/v4/projects/([^/]+)"), "get_project"),
+        ("GET", re.compile(r"/api/v4/projects/([^/]+)/repository/branches"), "list_branches"),
+        ("GET", re.compile(r"/api/v4/projects/([^/]+)/repository/branches/(.+)"), "get_branch"),
+        ("POST", re.compile(r"/api/v4/projects/([^/]+)/repository/branches"), "create_branch"),
+        ("GET", re.compile(r"/api/v4/projects/([^/]+)/repository/compare"), "compare"),
+        ("GET", re.compile(r"/api/v4/projects/([^/]+)/merge_requests"), "list_merge_requests"),
+        ("POST", re.compile(r"/api/v4/projects/([^/]+)/merge_requests"), "create_merge_request"),
+        ("PUT", re.compile(r"/api/v4/projects/([^/]+)/merge_requests/(\d+)/merge"), "accept_merge_request"),
+    ]
+
+    def get_project(self, project_id, query, body):
+        return 200, {"id": project_id, "name": f"project-{project_id}", "default_branch": "develop"}, None
+
+    def list_branches(self, project_id, query, body):
+        return self._page(self.data.branches, query)
+
+    def get_branch(self, project_id, name, query, body):
+        for branch in self.data.branches:
+            if branch["name"] == name:
+                return 200, branch, None
+        return 404, {"message": "404 Branch Not Found"}, None
+
+    def create_branch(self, project_id, query, body):
+        branch = {"name": (body or query)["branch"], "commit": {"id": _sha((body or query)["branch"])}, "merged": False}
+        with self.data.lock:
+            self.data.branches.append(branch)
+        return 201, branch, None
+
+    def compare(self, project_id, query, body):
+        return 200, {"commits": self.data.commits, "diffs": [], "compare_timeout": False}, None
+
+    def list_merge_requests(self, project_id, query, body):
+        state = query.get("state", "all")
+        items = [mr for mr in self.data.merge_requests if state == "all" or mr["state"] == state]
+        return self._page(items, query)
+
+    def create_merge_request(self, project_id, query, body):
+        with self.data.lock:
+            mr = {**(body or {}), "iid": len(self.data.merge_requests) + 1, "state": "opened", "merge_status": "checking"}
+            self.data.merge_requests.append(mr)
+        return 201, mr, None
+
+    def accept_merge_request(self, project_id, iid, query, body):
+        for mr in self.data.merge_requests:
+            if mr["iid"] == int(iid):
+                mr["state"] = "merged"
+                return 200, mr, None
+        return 404, {"message": "404 Not found"}, None
+
+
+class FakeYouTrackHandler(FakeHandler):
+    routes = [
+        ("GET", re.compile(r"/api/issues"), "list_issues"),
+        ("POST", re.compile(r"/api/issues"), "create_issue"),
+        ("GET", re.compile(r"/api/issues/([^/]+)"), "get_issue"),
+        ("POST", re.compile(r"/api/issues/([^/]+)"), "update_issue"),
+        ("POST", re.compile(r"/api/issues/([^/]+)/comments"), "add_comment"),
+        ("GET", re.compile(r"/api/issues/([^/]+)/links"), "get_links"),
+        ("POST", re.compile(r"/api/issues/([^/]+)/links"), "create_link"),
+    ]
+
+    def list_issues(self, query, body):
+        issues = sorted(self.data.issues.values(), key=lambda issue: issue["updated"])
+        skip = int(query.get("$skip", 0))
+        top = int(query.get("$top", 42))
+        return 200, issues[skip:skip + top], None
+
+    def _issue(self, issue_id):
+        return self.data.issues.get(issue_id) or next(
+            (issue for issue in self.data.issues.values() if issue["id"] == issue_id), None
+        )
+
+    def get_issue(self, issue_id, query, body):
+        issue = self._issue(issue_id)
+        if issue is None:
+            return 404, {"error": "Not Found"}, None
+        return 200, issue, None
+
+    def create_issue(self, query, body):
+        with self.data.lock:
+            number = len(self.data.issues) + 1
+            key = f"EXP-{number}"
+            issue = {
+                "id": f"2-{number}", "idReadable": key, "summary": (body or {}).get("summary"),
+                "description": (body or {}).get("description"), "updated": int(time.time() * 1000),
+                "tags": [], "customFields": [], "links": [], "comments": [],
+            }
+            self.data.issues[key] = issue
+        return 200, issue, None
+
+    def update_issue(self, issue_id, query, body):
+        issue = self._issue(issue_id)
+        if issue is None:
+            return 404, {"error": "Not Found"}, None
+        issue.update(body or {})
+        issue["updated"] = int(time.time() * 1000)
+        return 200, issue, None
+
+    def add_comment(self, issue_id, query, body):
+        issue = self._issue(issue_id)
+        if issue is None:
+            return 404, {"error": "Not Found"}, None
+        comment = {"id": str(len(issue["comments"]) + 1), "text": (body or {}).get("text")}
+        issue["comments"].append(comment)
+        return 200, comment, None
+
+    def get_links(self, issue_id, query, body):
+        issue = self._issue(issue_id)
+        if issue is None:
+            return 404, {"error": "Not Found"}, None
+        return 200, issue["links"], None
+
+    def create_link(self, issue_id, query, body):
+        issue = self._issue(issue_id)
+        if issue is None:
+            return 404, {"error": "Not Found"}, None
+        link = {"direction": "INWARD", "linkType": {"name": (body or {}).get("type")}, "issues": [{"idReadable": (body or {}).get("issueId")}]}
+        issue["links"].append(link)
+        return 200, link, None
+
+
+def start_fake_server(
+    handler: type,
+    config: FakeConfig,
+    data: FakeData,
+    host: str = "127.0.0.1",
+    port: int = 0
+) -> ThreadingHTTPServer:
+    """Start a fake server in a daemon thread; port 0 picks a free port."""
+    handler_class = type(handler.__name__, (handler,), {
+        "config": config,
+        "data": data,
+        "stats": {"requests": 0, "throttled": 0, "errors": 0, "not_modified": 0},
+    })
+    server = ThreadingHTTPServer((host, port), handler_class)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def server_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=FakeConfig.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=FakeConfig.jitter_ms)
+    parser.add_argument("--error-rate", type=float, default=FakeConfig.error_rate)
+    parser.add_argument("--throttle-rate", type=float, default=FakeConfig.throttle_rate)
+    parser.add_argument("--retry-after", type=int, default=FakeConfig.retry_after)
+    parser.add_argument("--branches", type=int, default=FakeConfig.branches)
+    parser.add_argument("--merge-requests", type=int, default=FakeConfig.merge_requests)
+    parser.add_argument("--issues", type=int, default=FakeConfig.issues)
+    parser.add_argument("--commits", type=int, default=FakeConfig.commits)
+
+
+def config_from_args(args: argparse.Namespace) -> FakeConfig:
+    return FakeConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        branches=args.branches,
+        merge_requests=args.merge_requests,
+        issues=args.issues,
+        commits=args.commits,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run fake GitLab and YouTrack servers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--gitlab-port", type=int, default=8081)
+    parser.add_argument("--youtrack-port", type=int, default=8082)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    config = config_from_args(args)
+    data = FakeData(config)
+    gitlab = start_fake_server(FakeGitLabHandler, config, data, args.host, args.gitlab_port)
+    youtrack = start_fake_server(FakeYouTrackHandler, config, data, args.host, args.youtrack_port)
+    print(f"GITLAB_URL={server_url(gitlab)}")
+    print(f"YOUTRACK_URL={server_url(youtrack)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        gitlab.shutdown()
+        youtrack.shutdown()
+
+
+if __name__ == "__main__":
+    main()